@@ -8,7 +8,7 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Type
+from typing import Any, Callable, Dict, List, Tuple, Type
 
 from ..core.models import Track
 
@@ -148,8 +148,10 @@ class EventBus:
 
     def __init__(self):
         """Initialize event bus."""
-        self._listeners: Dict[Type[Event], List[IEventListener]] = {}
-        self._global_listeners: List[IEventListener] = []
+        # Listener collections are immutable tuples replaced on (un)subscribe, so
+        # publishing iterates a stable snapshot without copying or locking
+        self._listeners: Dict[Type[Event], Tuple[IEventListener, ...]] = {}
+        self._global_listeners: Tuple[IEventListener, ...] = ()
 
     def subscribe(self, event_type: Type[Event], listener: IEventListener) -> None:
         """
@@ -159,10 +161,7 @@ class EventBus:
             event_type: Type of event to listen for
             listener: Listener to subscribe
         """
-        if event_type not in self._listeners:
-            self._listeners[event_type] = []
-
-        self._listeners[event_type].append(listener)
+        self._listeners[event_type] = self._listeners.get(event_type, ()) + (listener,)
         logger.debug(f"Subscribed {listener.__class__.__name__} to {event_type.__name__}")
 
     def subscribe_all(self, listener: IEventListener) -> None:
@@ -172,7 +171,7 @@ class EventBus:
         Args:
             listener: Listener to subscribe
         """
-        self._global_listeners.append(listener)
+        self._global_listeners += (listener,)
         logger.debug(f"Subscribed {listener.__class__.__name__} to all events")
 
     def unsubscribe(self, event_type: Type[Event], listener: IEventListener) -> None:
@@ -183,14 +182,11 @@ class EventBus:
             event_type: Event type to unsubscribe from
             listener: Listener to unsubscribe
         """
-        if event_type in self._listeners:
-            try:
-                self._listeners[event_type].remove(listener)
-                logger.debug(
-                    f"Unsubscribed {listener.__class__.__name__} from {event_type.__name__}"
-                )
-            except ValueError:
-                pass
+        listeners = self._listeners.get(event_type, ())
+        if listener in listeners:
+            index = listeners.index(listener)
+            self._listeners[event_type] = listeners[:index] + listeners[index + 1 :]
+            logger.debug(f"Unsubscribed {listener.__class__.__name__} from {event_type.__name__}")
 
     def publish(self, event: Event) -> None:
         """
@@ -203,7 +199,7 @@ class EventBus:
         logger.debug(f"Publishing event: {event_type.__name__}")
 
         # Notify specific listeners
-        for listener in self._listeners.get(event_type, []):
+        for listener in self._listeners.get(event_type, ()):
             try:
                 listener.on_event(event)
             except Exception as e:
@@ -219,7 +215,7 @@ class EventBus:
     def clear(self) -> None:
         """Clear all subscriptions."""
         self._listeners.clear()
-        self._global_listeners.clear()
+        self._global_listeners = ()
         logger.debug("Cleared all event subscriptions")
 
 
@@ -4,11 +4,13 @@ Command Handlers
 Implements command handlers that orchestrate business logic.
 """
 
+import html
 import logging
 import time
 from datetime import datetime
 from typing import List, Union
 
+from ..core.api_limits import SPOTIFY_ADD_LIMIT
 from ..core.chart_interfaces import IChartProvider
 from ..core.interfaces import IPlaylistOperations, ITrackOperations, ITrackReader
 from ..core.models import Track
@@ -92,7 +94,7 @@ class CreatePlaylistHandler(
                 ScrapingStartedEvent(region=command.region, limit=command.limit)
             )
 
-            start_time = time.time()
+            start_time = time.perf_counter()
             chart_result = self._chart_provider.get_charts(command.region, command.limit)
 
             if chart_result.is_failure():
@@ -101,7 +103,7 @@ class CreatePlaylistHandler(
                 return Failure(error)
 
             tracks = chart_result.unwrap()
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             self._event_bus.publish(
                 ScrapingCompletedEvent(
@@ -222,8 +224,10 @@ class CreatePlaylistHandler(
             playlist_id = existing_playlist["id"]
             playlist_url = existing_playlist["external_urls"]["spotify"]
 
-            # Update description
-            self._playlist_ops.update_details(playlist_id, request.description)
+            # Update description, unless it already matches (the API returns it HTML-escaped)
+            current_description = html.unescape(existing_playlist.get("description") or "")
+            if request.description and request.description != current_description:
+                self._playlist_ops.update_details(playlist_id, request.description)
 
             # Handle tracks based on update mode
             if request.update_mode == "replace":
@@ -285,11 +289,10 @@ class CreatePlaylistHandler(
             return 0, 0, []
 
         # Convert IDs to URIs
-        track_uris = [self._track_ops.build_uri(tid) for tid in track_ids]
+        track_uris = self._track_ops.build_uris(track_ids)
 
         try:
-            # Add tracks in batches of 100 (Spotify API limit)
-            batch_size = 100
+            batch_size = SPOTIFY_ADD_LIMIT
             total_added = 0
             errors = []
 
@@ -343,7 +346,7 @@ class PreviewChartsHandler(ICommandHandler[ChartPreviewResponse, Exception]):
                 ScrapingStartedEvent(region=command.region, limit=command.limit)
             )
 
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = self._chart_provider.get_charts(command.region, command.limit)
 
             if result.is_failure():
@@ -352,7 +355,7 @@ class PreviewChartsHandler(ICommandHandler[ChartPreviewResponse, Exception]):
                 return Failure(error)
 
             tracks = result.unwrap()
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             self._event_bus.publish(
                 ScrapingCompletedEvent(
@@ -400,7 +400,7 @@ class PreviewChartsQueryHandler(IQueryHandler[ChartPreviewResponse, Exception]):
 
             self._event_bus.publish(ScrapingStartedEvent(region=query.region, limit=query.limit))
 
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = self._chart_provider.get_charts(query.region, query.limit)
 
             if result.is_failure():
@@ -409,7 +409,7 @@ class PreviewChartsQueryHandler(IQueryHandler[ChartPreviewResponse, Exception]):
                 return Failure(error)
 
             tracks = result.unwrap()
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             self._event_bus.publish(
                 ScrapingCompletedEvent(
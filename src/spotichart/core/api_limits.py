@@ -0,0 +1,43 @@
+"""
+Spotify API Limits
+
+Maximum batch sizes accepted by the Spotify Web API endpoints used here.
+"""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Items per "add items to playlist" request
+SPOTIFY_ADD_LIMIT = 100
+
+# Items per "remove playlist items" request
+SPOTIFY_REMOVE_LIMIT = 100
+
+# IDs per "get several tracks" request
+SPOTIFY_TRACKS_LIMIT = 50
+
+
+def clamp_batch_size(batch_size: Optional[int], limit: int) -> int:
+    """
+    Clamp a configured batch size to what an endpoint accepts.
+
+    Larger batches would be rejected by the API, and smaller ones only
+    multiply the number of requests, so anything but a sane value below
+    the limit is snapped into range.
+
+    Args:
+        batch_size: Configured batch size (None uses the limit)
+        limit: Endpoint maximum
+
+    Returns:
+        Batch size between 1 and limit
+    """
+    if batch_size is None:
+        return limit
+
+    clamped = max(1, min(int(batch_size), limit))
+    if clamped != batch_size:
+        logger.warning(f"Batch size {batch_size} is out of range, using {clamped}")
+    return clamped
@@ -0,0 +1,150 @@
+"""
+Backoff Helpers
+
+Rate-limit aware retry policy shared by Spotify API callers.
+"""
+
+import logging
+import random
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 30.0
+
+
+def get_status_code(error: Exception) -> Optional[int]:
+    """
+    Get the HTTP status code carried by an error, if any.
+
+    Understands spotipy's ``SpotifyException.http_status`` and requests'
+    ``HTTPError.response.status_code``.
+    """
+    status = getattr(error, "http_status", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Get the ``Retry-After`` delay (in seconds) sent with an error, if any.
+
+    Args:
+        error: Exception raised by an HTTP call
+
+    Returns:
+        Delay in seconds, or None if the server did not send one
+    """
+    headers = getattr(error, "headers", None)
+    if not headers:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Check whether an error is worth retrying.
+
+    Rate limits (429) and server errors (5xx) are retryable, as are transport
+    errors without a status code. Other client errors are not.
+    """
+    status = get_status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(error, OSError)
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """
+    Check whether an error is a rate-limit (429) response.
+
+    Use as the retry predicate for non-idempotent calls, where a 429 is
+    known not to have been applied but a 5xx might have been.
+    """
+    return get_status_code(error) == 429
+
+
+def compute_delay(
+    error: Exception,
+    attempt: int,
+    base_delay: float = DEFAULT_BASE_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY,
+) -> float:
+    """
+    Compute how long to wait before the next attempt.
+
+    Honors ``Retry-After`` when present, otherwise uses exponential backoff
+    with full jitter so concurrent workers do not retry in lock-step.
+
+    Args:
+        error: Exception raised by the failed attempt
+        attempt: Number of the failed attempt (1-based)
+        base_delay: Delay for the first retry in seconds
+        max_delay: Upper bound for any delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    retry_after = get_retry_after(error)
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    return random.uniform(0, min(max_delay, base_delay * (2 ** (attempt - 1))))
+
+
+def call_with_backoff(
+    func: Callable[..., T],
+    *args: Any,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    base_delay: float = DEFAULT_BASE_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    retryable: Callable[[Exception], bool] = is_retryable,
+    **kwargs: Any,
+) -> T:
+    """
+    Call a function, retrying retryable errors with backoff.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for func
+        max_attempts: Maximum number of attempts
+        base_delay: Delay for the first retry in seconds
+        max_delay: Upper bound for any delay in seconds
+        retryable: Predicate deciding whether an error is worth retrying
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+
+    Raises:
+        The last error if all attempts fail or the error is not retryable
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt >= max_attempts or not retryable(e):
+                raise
+
+            delay = compute_delay(e, attempt, base_delay, max_delay)
+            logger.warning(
+                f"{getattr(func, '__name__', 'call')} failed "
+                f"(attempt {attempt}/{max_attempts}): {e}. Retrying in {delay:.2f}s..."
+            )
+            time.sleep(delay)
+
+    raise RuntimeError("call_with_backoff requires max_attempts >= 1")
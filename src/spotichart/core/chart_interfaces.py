@@ -5,11 +5,15 @@ Abstractions for scraping music charts following Open/Closed Principle.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
 from ..utils.result import Result
 from .models import ChartEntry, Track
 
+# Regions fetched at once by IChartProvider.get_charts_many
+CHART_FETCH_WORKERS = 4
+
 
 class IHttpClient(ABC):
     """Interface for HTTP client operations."""
@@ -69,6 +73,31 @@ class IChartProvider(ABC):
         """
         pass
 
+    def get_charts_many(
+        self, regions: List[str], limit: int = 1000, max_workers: int = CHART_FETCH_WORKERS
+    ) -> Dict[str, Result[List[Track], Exception]]:
+        """
+        Get chart tracks for several regions concurrently.
+
+        Each region is fetched and parsed on a worker thread; a failing
+        region only fails its own Result.
+
+        Args:
+            regions: Region names
+            limit: Maximum number of tracks per region
+            max_workers: Maximum number of regions fetched at once
+
+        Returns:
+            Result per region, in the order given
+        """
+        regions = list(dict.fromkeys(regions))
+        if not regions:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(regions))) as executor:
+            results = executor.map(lambda region: self.get_charts(region, limit), regions)
+            return dict(zip(regions, results))
+
     @abstractmethod
     def get_available_regions(self) -> List[str]:
         """
@@ -0,0 +1,169 @@
+"""
+Concurrency Helpers
+
+Thread-pool helpers for overlapping blocking Spotify API round trips.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Spotipy calls are blocking socket I/O, so a handful of threads is enough
+DEFAULT_MAX_WORKERS = 8
+
+
+def fetch_remaining_pages(
+    first_page: Dict,
+    fetch_page: Callable[[int], Dict],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_items: Optional[int] = None,
+) -> Iterator[Dict]:
+    """
+    Yield the pages following a Spotify paging object, in offset order.
+
+    Once the first page reveals ``total``, all remaining offsets are known and
+    requested concurrently. Pages without ``total`` fall back to sequential
+    fetching, one page ahead of the caller, until ``next`` is empty or a
+    short page marks the end of the list. Closing the iterator early (e.g. after a
+    match) cancels requests that have not started yet.
+
+    Args:
+        first_page: Already-fetched first page (with ``items``, ``limit``, ``next``)
+        fetch_page: Callable fetching the page at a given offset
+        max_workers: Maximum number of concurrent requests
+        max_items: Stop before offsets at or past this many items (None for all)
+
+    Yields:
+        Subsequent pages, in the same order sequential pagination would return them
+    """
+    if not first_page or not first_page.get("next"):
+        return
+
+    page_size = first_page.get("limit") or len(first_page.get("items", []))
+    if not page_size or len(first_page.get("items", [])) < page_size:
+        # A short first page is the whole list, whatever ``next`` says
+        return
+
+    offset = first_page.get("offset", 0) + page_size
+    total = first_page.get("total")
+
+    if total is None:
+        yield from _prefetch_sequential(fetch_page, offset, page_size, max_items)
+        return
+
+    end = total if max_items is None else min(total, max_items)
+    offsets = range(offset, end, page_size)
+    if not offsets:
+        return
+
+    logger.debug(f"Fetching {len(offsets)} remaining pages concurrently")
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(offsets)))
+    try:
+        futures = [executor.submit(fetch_page, page_offset) for page_offset in offsets]
+        for future in futures:
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _prefetch_sequential(
+    fetch_page: Callable[[int], Dict],
+    offset: int,
+    page_size: int,
+    max_items: Optional[int] = None,
+) -> Iterator[Dict]:
+    """
+    Page sequentially, requesting each page while the caller consumes the previous one.
+
+    Args:
+        fetch_page: Callable fetching the page at a given offset
+        offset: Offset of the first page to fetch
+        page_size: Number of items per page
+        max_items: Stop before offsets at or past this many items (None for all)
+
+    Yields:
+        Pages until ``next`` is empty or a short page marks the end of the list
+    """
+    if max_items is not None and offset >= max_items:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(fetch_page, offset)
+        while future is not None:
+            page = future.result()
+            offset += page_size
+            has_more = page and page.get("next") and len(page.get("items", [])) >= page_size
+            if max_items is not None and offset >= max_items:
+                has_more = False
+            future = executor.submit(fetch_page, offset) if has_more else None
+            yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_batches(
+    operation: Callable[[List[T]], Any],
+    batches: Sequence[List[T]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[Tuple[int, Exception]]:
+    """
+    Run an operation over independent batches concurrently.
+
+    Only use for batches whose effects do not depend on order (e.g. removals).
+    A failing batch does not stop the others.
+
+    Args:
+        operation: Callable applied to each batch
+        batches: Batches to process
+        max_workers: Maximum number of concurrent calls
+
+    Returns:
+        List of (batch_index, error) for failed batches, in batch order
+    """
+    if not batches:
+        return []
+
+    failures: List[Tuple[int, Exception]] = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        futures = [executor.submit(operation, batch) for batch in batches]
+        for index, future in enumerate(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failures.append((index, e))
+
+    return failures
+
+
+def map_batches(
+    operation: Callable[[List[T]], R],
+    batches: Sequence[List[T]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[R]:
+    """
+    Run an operation over batches concurrently and collect the results in batch order.
+
+    Args:
+        operation: Callable applied to each batch
+        batches: Batches to process
+        max_workers: Maximum number of concurrent calls
+
+    Returns:
+        One result per batch, in batch order
+
+    Raises:
+        The first error raised by any batch
+    """
+    if not batches:
+        return []
+    if len(batches) == 1:
+        return [operation(batches[0])]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        return list(executor.map(operation, batches))
@@ -12,7 +12,7 @@ from typing import Optional
 from ..utils.configuration_provider import ConfigurationProvider
 from ..utils.interfaces import IConfiguration
 from .interfaces import IPlaylistOperations, ISpotifyClient, ITrackOperations
-from .playlist_cache import PlaylistCache
+from .playlist_cache import PlaylistCache, create_playlist_cache
 from .playlist_manager import PlaylistManager
 from .spotify_authenticator import SpotifyAuthenticator
 from .spotify_client import SpotifyClient
@@ -117,11 +117,11 @@ class DependencyContainer:
 
             if cache_enabled:
                 cache_file_str = self._config.get(
-                    "cache.playlist_cache_file", ".spotichart/cache/playlists.json"
+                    "cache.playlist_cache_file", ".spotichart/cache/playlists.db"
                 )
                 cache_file = Path.home() / cache_file_str
-                self._playlist_cache = PlaylistCache(
-                    cache_file=cache_file, ttl_hours=cache_ttl_hours
+                self._playlist_cache = create_playlist_cache(
+                    cache_file, ttl_hours=cache_ttl_hours
                 )
             else:
                 # In-memory cache only
@@ -154,7 +154,10 @@ class DependencyContainer:
         if self._track_manager is None:
             logger.info("Creating TrackManager")
             client = self.get_spotify_client()
-            self._track_manager = TrackManager(client=client)
+            batch_size = self._config.get("spotify.batch_size")
+            self._track_manager = TrackManager(
+                client=client, batch_size=int(batch_size) if batch_size else None
+            )
 
         return self._track_manager
 
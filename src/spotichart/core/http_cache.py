@@ -0,0 +1,166 @@
+"""
+HTTP Cache Module
+
+Stores fetched pages with their validators so repeat fetches can use
+conditional GET requests.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bytes of cached responses kept before the oldest entries are dropped
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class HttpResponseCache:
+    """Disk cache of response bodies keyed by URL, with ETag/Last-Modified validators."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize HTTP response cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per cached URL
+            max_bytes: Total size of cached responses kept (oldest dropped first)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        # The directory is scanned once per instance, on its first write
+        self._pruned = False
+
+    def _scan_entries(self) -> List[os.DirEntry]:
+        """List the cache entry files, reusing the stat data the directory scan returns."""
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                return [
+                    entry
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return []
+
+    def prune(self) -> int:
+        """
+        Drop the oldest cached responses until the cache fits within max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = [(entry, entry.stat(follow_symlinks=False)) for entry in self._scan_entries()]
+        total = sum(stat.st_size for _, stat in entries)
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for entry, stat in sorted(entries, key=lambda item: item[1].st_mtime):
+            if total <= self.max_bytes:
+                break
+            if self._remove(entry.path):
+                removed += 1
+                total -= stat.st_size
+
+        logger.debug(f"Pruned {removed} HTTP cache entries")
+        return removed
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """Delete one cache entry file, returning whether it is gone."""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove HTTP cache entry {path}: {str(e)}")
+            return False
+        return True
+
+    def _entry_path(self, url: str) -> Path:
+        """Get the file path for a URL's cache entry."""
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Get the cached entry for a URL.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            Dict with ``etag``, ``last_modified`` and ``content``, or None on miss
+        """
+        path = self._entry_path(url)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to read HTTP cache entry for {url}: {str(e)}")
+            return None
+
+        if entry.get("url") != url or "content" not in entry:
+            return None
+        return entry
+
+    def get_validators(self, url: str) -> Dict[str, str]:
+        """
+        Build conditional request headers for a URL.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            ``If-None-Match``/``If-Modified-Since`` headers, empty if nothing is cached
+        """
+        entry = self.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(
+        self, url: str, content: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> None:
+        """
+        Store a response for a URL.
+
+        Responses without any validator are not stored since they can never
+        be revalidated. The first write of each instance also prunes the
+        cache back within max_bytes.
+
+        Args:
+            url: Requested URL
+            content: Decoded response body
+            etag: ``ETag`` response header
+            last_modified: ``Last-Modified`` response header
+        """
+        if not etag and not last_modified:
+            return
+
+        entry = {"url": url, "etag": etag, "last_modified": last_modified, "content": content}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._entry_path(url), "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            logger.debug(f"Cached response for {url}")
+        except OSError as e:
+            logger.warning(f"Failed to write HTTP cache entry for {url}: {str(e)}")
+            return
+
+        if not self._pruned:
+            self._pruned = True
+            self.prune()
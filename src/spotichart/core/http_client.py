@@ -9,13 +9,19 @@ import time
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..utils.exceptions import ScrapingError
 from ..utils.result import Failure, Result, Success
+from .backoff import compute_delay, is_retryable
 from .chart_interfaces import IHttpClient
 
 logger = logging.getLogger(__name__)
 
+# Hosts kept in the connection pool, and connections kept per host (one per concurrent sync)
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 8
+
 
 class RetryHttpClient(IHttpClient):
     """HTTP client with retry logic and user agent handling."""
@@ -26,6 +32,7 @@ class RetryHttpClient(IHttpClient):
         max_retries: int = 3,
         retry_delay: int = 2,
         user_agent: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize HTTP client.
@@ -35,18 +42,32 @@ class RetryHttpClient(IHttpClient):
             max_retries: Maximum number of retry attempts
             retry_delay: Base delay between retries in seconds
             user_agent: Custom user agent string
+            session: Session to send requests with (defaults to a pooled session)
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.session = requests.Session()
+        self.session = session or self._build_session()
 
         # Set user agent
         ua = user_agent or (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         )
-        self.session.headers.update({"User-Agent": ua})
+        self.session.headers.update({"User-Agent": ua, "Accept-Encoding": "gzip, deflate"})
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """
+        Build a session whose keep-alive connections are shared across fetches.
+
+        Retries stay in fetch, so the adapter does not retry on its own.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def fetch(self, url: str, timeout: Optional[int] = None) -> Result[str, Exception]:
         """
@@ -75,12 +96,16 @@ class RetryHttpClient(IHttpClient):
                 last_error = e
                 logger.warning(f"Attempt {attempt} failed: {str(e)}")
 
+                if not is_retryable(e):
+                    break
+
                 if attempt < self.max_retries:
-                    sleep_time = self.retry_delay * attempt
-                    logger.info(f"Retrying in {sleep_time} seconds...")
+                    # Jittered exponential backoff, or the server's Retry-After
+                    sleep_time = compute_delay(e, attempt, base_delay=self.retry_delay)
+                    logger.info(f"Retrying in {sleep_time:.2f} seconds...")
                     time.sleep(sleep_time)
 
-        error_msg = f"Failed to fetch {url} after {self.max_retries} attempts: {str(last_error)}"
+        error_msg = f"Failed to fetch {url}: {str(last_error)}"
         logger.error(error_msg)
         return Failure(ScrapingError(error_msg))
 
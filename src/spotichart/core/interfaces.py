@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
+# Concurrent single-track requests in the ITrackReader.tracks fallback
+TRACK_FETCH_WORKERS = 8
+
 # ============================================================================
 # SEGREGATED INTERFACES (Interface Segregation Principle)
 # ============================================================================
@@ -16,6 +20,11 @@ class ISpotifyUserAuth(ABC):
         pass
 
 
+# Field projection for playlist track pages when only track URIs are needed
+# (paging keys are kept so pagination keeps working)
+TRACK_URI_FIELDS = "items(track(uri)),limit,next,offset,total"
+
+
 class IPlaylistReader(ABC):
     """Interface for reading playlist data."""
 
@@ -25,8 +34,10 @@ class IPlaylistReader(ABC):
         pass
 
     @abstractmethod
-    def playlist_tracks(self, playlist_id: str) -> Dict:
-        """Get tracks from a playlist."""
+    def playlist_tracks(
+        self, playlist_id: str, offset: int = 0, fields: Optional[str] = None
+    ) -> Dict:
+        """Get tracks from a playlist, starting at the given offset, optionally projected."""
         pass
 
     @abstractmethod
@@ -66,6 +77,25 @@ class ITrackReader(ABC):
         """Get track information by ID."""
         pass
 
+    def tracks(self, track_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Get track information for many IDs; override for a bulk request path.
+
+        This fallback fetches tracks one by one, concurrently. A track that
+        fails to load maps to None.
+        """
+        if not track_ids:
+            return {}
+
+        def fetch(track_id: str) -> Optional[Dict]:
+            try:
+                return self.track(track_id)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(TRACK_FETCH_WORKERS, len(track_ids))) as executor:
+            return dict(zip(track_ids, executor.map(fetch, track_ids)))
+
 
 class ITrackWriter(ABC):
     """Interface for writing/modifying tracks in playlists."""
@@ -143,3 +173,8 @@ class ITrackOperations(ABC):
     @abstractmethod
     def build_uri(self, track_id: str) -> str:
         pass
+
+    def build_uris(self, track_ids: list, dedupe: bool = True) -> list:
+        """Build track URIs for many IDs; override for a faster bulk path."""
+        uris = [self.build_uri(track_id) for track_id in track_ids]
+        return list(dict.fromkeys(uris)) if dedupe else uris
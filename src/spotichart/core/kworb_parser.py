@@ -5,9 +5,9 @@ Parses HTML from Kworb.net to extract chart data.
 """
 
 import logging
-from typing import List
+from typing import Iterator, List
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from ..utils.exceptions import ScrapingError
 from ..utils.result import Failure, Result, Success
@@ -16,18 +16,16 @@ from .models import ChartEntry
 
 logger = logging.getLogger(__name__)
 
+# Characters of HTML fed to the pull parser at a time; parsing stops once enough rows are read
+FEED_CHUNK_SIZE = 64 * 1024
+
 
 class KworbChartParser(IChartParser):
     """Parser for Kworb.net chart HTML."""
 
-    # Table selectors to try in order
-    TABLE_SELECTORS = [
-        {"class": "display"},
-        {"class": "addpos"},
-        {"id": "spotifyweekly"},
-        {"class": "data"},
-        {"class": "chart"},
-    ]
+    # Known chart table markups; the first table matching any of them is used
+    TABLE_CLASSES = frozenset({"display", "addpos", "data", "chart"})
+    TABLE_IDS = frozenset({"spotifyweekly"})
 
     def __init__(self, region: str = "global"):
         """
@@ -50,60 +48,140 @@ class KworbChartParser(IChartParser):
             Result with list of chart entries or error
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Find table
-            table = self._find_table(soup)
-            if not table:
-                error_msg = "Table not found - site structure may have changed"
-                logger.error(error_msg)
-                return Failure(ScrapingError(error_msg))
-
-            # Extract entries
-            entries = self._extract_entries(table, limit)
+            entries = self._extract_entries(self._iter_row_track_ids(html, limit))
             logger.info(f"Extracted {len(entries)} chart entries")
             return Success(entries)
 
+        except ScrapingError as e:
+            logger.error(str(e))
+            return Failure(e)
+
         except Exception as e:
             error_msg = f"Failed to parse HTML: {str(e)}"
             logger.error(error_msg)
             return Failure(ScrapingError(error_msg))
 
-    def _find_table(self, soup: BeautifulSoup):
-        """Find the chart table using multiple selectors."""
-        for selector in self.TABLE_SELECTORS:
-            table = soup.find("table", selector)
-            if table:
-                logger.debug(f"Found table with selector: {selector}")
-                return table
-        return None
-
-    def _extract_entries(self, table, limit: int) -> List[ChartEntry]:
-        """Extract chart entries from table."""
-        tbody = table.find("tbody")
-        if not tbody:
-            raise ScrapingError("Table body not found")
+    def parse_track_ids(self, html: str, limit: int) -> Result[List[str], Exception]:
+        """
+        Parse HTML content to extract raw Spotify track IDs.
+
+        Skips ChartEntry construction for callers that only need IDs in bulk.
 
-        rows = tbody.find_all("tr", limit=limit)
-        logger.info(f"Found {len(rows)} rows in table")
+        Args:
+            html: HTML content
+            limit: Maximum number of rows to scan
 
-        entries = []
-        for position, row in enumerate(rows, start=1):
-            track_id = self._extract_track_id(row)
-            if track_id:
-                entry = ChartEntry(track_id=track_id, position=position, region=self.region)
-                entries.append(entry)
+        Returns:
+            Result with list of track IDs in chart order or error
+        """
+        try:
+            track_ids = [tid for tid in self._iter_row_track_ids(html, limit) if tid]
+            logger.info(f"Extracted {len(track_ids)} track IDs")
+            return Success(track_ids)
 
-        return entries
+        except ScrapingError as e:
+            logger.error(str(e))
+            return Failure(e)
 
-    def _extract_track_id(self, row) -> str:
-        """Extract Spotify track ID from table row."""
-        cells = row.find_all("a")
+        except Exception as e:
+            error_msg = f"Failed to parse HTML: {str(e)}"
+            logger.error(error_msg)
+            return Failure(ScrapingError(error_msg))
+
+    def _iter_row_track_ids(self, html: str, limit: int) -> Iterator[str]:
+        """
+        Stream the chart table's body rows, yielding each row's track ID.
+
+        The HTML is fed to a pull parser in chunks and each row is discarded
+        once read, so only the current row is kept in memory and parsing
+        stops as soon as ``limit`` rows have been read.
+
+        Args:
+            html: HTML content
+            limit: Maximum number of rows to read (0 or None for all)
 
-        for cell in cells:
-            href = cell.attrs.get("href", "")
+        Yields:
+            Track ID per row, or an empty string for rows without a track link
+
+        Raises:
+            ScrapingError: If the table or its body cannot be found
+        """
+        table = None
+        nested_tables = 0
+        in_body = found_body = False
+        row_count = 0
+
+        for event, element in self._pull_events(html):
+            tag = element.tag
+            if table is None:
+                if event == "start" and tag == "table" and self._is_chart_table(element):
+                    table = element
+                continue
+
+            if element is table:
+                break
+            if tag == "table":
+                nested_tables += 1 if event == "start" else -1
+                continue
+            if nested_tables:
+                continue
+
+            if tag == "tbody":
+                in_body = event == "start"
+                found_body = True
+            elif tag == "tr" and event == "end" and in_body:
+                yield self._extract_track_id(element)
+                row_count += 1
+                self._discard(element)
+                if limit and row_count >= limit:
+                    break
+
+        if table is None:
+            raise ScrapingError("Table not found - site structure may have changed")
+        if not found_body:
+            raise ScrapingError("Table body not found")
+
+        logger.info(f"Found {row_count} rows in table")
+
+    @staticmethod
+    def _pull_events(html: str) -> Iterator[tuple]:
+        """Feed HTML to a pull parser chunk by chunk, yielding (event, element) pairs."""
+        parser = etree.HTMLPullParser(events=("start", "end"))
+        for offset in range(0, len(html), FEED_CHUNK_SIZE):
+            parser.feed(html[offset : offset + FEED_CHUNK_SIZE])
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    def _is_chart_table(self, element) -> bool:
+        """Check whether a table element matches a known chart table markup."""
+        if element.get("id") in self.TABLE_IDS:
+            return True
+        return not self.TABLE_CLASSES.isdisjoint((element.get("class") or "").split())
+
+    @staticmethod
+    def _discard(row) -> None:
+        """Free a processed row and the rows before it."""
+        row.clear()
+        parent = row.getparent()
+        while row.getprevious() is not None:
+            del parent[0]
+
+    def _extract_entries(self, track_ids: Iterator[str]) -> List[ChartEntry]:
+        """Build chart entries from per-row track IDs, positioned by row."""
+        region = self.region
+        return [
+            ChartEntry(track_id=track_id, position=position, region=region)
+            for position, track_id in enumerate(track_ids, start=1)
+            if track_id
+        ]
+
+    @staticmethod
+    def _extract_track_id(row) -> str:
+        """Extract Spotify track ID from table row."""
+        for link in row.iter("a"):
+            href = link.get("href", "")
             if href.startswith("../track"):
-                track_id = href.replace("../track/", "").replace(".html", "").strip()
-                return track_id
+                return href.replace("../track/", "").replace(".html", "").strip()
 
         return ""
@@ -89,11 +89,8 @@ class KworbChartProvider(IChartProvider):
         logger.info(f"Fetching {region} charts from Kworb (limit: {limit})")
 
         try:
-            # Get URL for region
-            url = self._url_mapper.get_url(region)
-
             # Fetch HTML
-            html_result = self._http_client.fetch(url)
+            html_result = self._fetch_html(region)
             if html_result.is_failure():
                 return html_result
 
@@ -124,6 +121,60 @@ class KworbChartProvider(IChartProvider):
             logger.error(error_msg)
             return Failure(ScrapingError(error_msg))
 
+    def get_chart_uris(self, region: str, limit: int = 1000) -> Result[List[str], Exception]:
+        """
+        Get chart track URIs for a specific region.
+
+        Bulk path for callers that only need URIs (e.g. adding to a playlist):
+        builds the URI strings straight from the parsed IDs without creating
+        intermediate ChartEntry/Track objects.
+
+        Args:
+            region: Region name (e.g., 'brazil', 'global', 'us')
+            limit: Maximum number of tracks to retrieve
+
+        Returns:
+            Result with list of Spotify track URIs or error
+        """
+        logger.info(f"Fetching {region} chart URIs from Kworb (limit: {limit})")
+
+        try:
+            html_result = self._fetch_html(region)
+            if html_result.is_failure():
+                return html_result
+
+            ids_result = KworbChartParser(region=region).parse_track_ids(
+                html_result.unwrap(), limit
+            )
+            if ids_result.is_failure():
+                return ids_result
+
+            uris = [f"spotify:track:{tid}" for tid in ids_result.unwrap()]
+
+            logger.info(f"Successfully retrieved {len(uris)} track URIs from {region}")
+            return Success(uris)
+
+        except ValueError as e:
+            # Region not supported
+            error_msg = str(e)
+            logger.error(error_msg)
+            return Failure(ScrapingError(error_msg))
+
+        except Exception as e:
+            error_msg = f"Failed to fetch charts: {str(e)}"
+            logger.error(error_msg)
+            return Failure(ScrapingError(error_msg))
+
+    def _fetch_html(self, region: str) -> Result[str, Exception]:
+        """
+        Fetch chart HTML for a region.
+
+        Raises:
+            ValueError: If region is not supported
+        """
+        url = self._url_mapper.get_url(region)
+        return self._http_client.fetch(url)
+
     def get_available_regions(self) -> List[str]:
         """Get list of available regions for this provider."""
         return self._url_mapper.get_available_regions()
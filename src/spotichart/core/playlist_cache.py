@@ -4,32 +4,155 @@ Playlist Cache Module
 Handles caching of playlist data following Single Responsibility Principle.
 """
 
+import atexit
 import json
 import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Playlist fields read by cache consumers; everything else is dropped before caching
+CACHED_PLAYLIST_KEYS = (
+    "id",
+    "name",
+    "uri",
+    "snapshot_id",
+    "public",
+    "description",
+    "external_urls",
+)
+
+# Seconds between a cache change and its write to disk
+CACHE_FLUSH_INTERVAL = float(os.getenv("CACHE_FLUSH_INTERVAL", "30"))
+
+# Cache file suffixes that select the SQLite backend
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+# File-backed caches still alive; pending changes are flushed at interpreter exit
+_LIVE_CACHES: "weakref.WeakSet[PlaylistCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_caches() -> None:
+    """Persist pending changes of every live file-backed cache."""
+    for cache in list(_LIVE_CACHES):
+        try:
+            cache.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush playlist cache {cache.cache_file}: {str(e)}")
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize JSON to bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _to_timestamp(value: Any) -> float:
+    """Convert a stored ``cached_at`` value (epoch or legacy ISO string) to epoch seconds."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
 
 class PlaylistCache:
     """Manages caching of playlist information."""
 
-    def __init__(self, cache_file: Optional[Path] = None, ttl_hours: int = 24):
+    def __init__(
+        self,
+        cache_file: Optional[Path] = None,
+        ttl_hours: int = 24,
+        flush_interval: float = CACHE_FLUSH_INTERVAL,
+    ):
         """
         Initialize playlist cache.
 
         Args:
             cache_file: Path to cache file (if None, uses in-memory cache only)
             ttl_hours: Time to live for cache entries in hours
+            flush_interval: Seconds to wait before writing pending changes to disk
         """
         self.cache_file = cache_file
         self.ttl = timedelta(hours=ttl_hours)
+        self.flush_interval = flush_interval
         self._cache: Dict[str, Dict] = {}
+        # Keys changed in memory since the last write
+        self._dirty: Set[str] = set()
+        self._mtime: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
 
         if cache_file:
             self._load_from_file()
+            # Writes are coalesced in memory; anything still pending is persisted at exit
+            _LIVE_CACHES.add(self)
+
+    @staticmethod
+    def normalize_key(name: str) -> str:
+        """
+        Normalize a playlist name into a cache key.
+
+        Args:
+            name: Playlist name
+
+        Returns:
+            Case-insensitive, whitespace-trimmed key
+        """
+        return name.lower().strip()
+
+    @staticmethod
+    def slim_playlist(playlist: Dict) -> Dict:
+        """
+        Project a Spotify playlist object onto the fields worth caching.
+
+        Args:
+            playlist: Playlist data as returned by Spotify
+
+        Returns:
+            Playlist data restricted to CACHED_PLAYLIST_KEYS
+        """
+        return {key: playlist[key] for key in CACHED_PLAYLIST_KEYS if key in playlist}
+
+    def _file_mtime(self) -> Optional[float]:
+        """Get the cache file's modification time, or None if it does not exist."""
+        try:
+            return os.stat(self.cache_file).st_mtime
+        except OSError:
+            return None
+
+    def _read_file(self) -> Dict[str, Dict]:
+        """Read unexpired entries from the cache file."""
+        with open(self.cache_file, "rb") as f:
+            cache_data = _loads(f.read())
+
+        # Filter out expired entries
+        oldest = time.time() - self.ttl.total_seconds()
+        return {
+            key: value["playlist"]
+            for key, value in cache_data.items()
+            if _to_timestamp(value.get("cached_at", "")) > oldest
+        }
 
     def _load_from_file(self) -> None:
         """Load cache from file if it exists."""
@@ -37,22 +160,39 @@ class PlaylistCache:
             return
 
         try:
-            with open(self.cache_file, "r") as f:
-                cache_data = json.load(f)
-
-            # Filter out expired entries
-            now = datetime.now()
-            for key, value in cache_data.items():
-                cached_at = datetime.fromisoformat(value.get("cached_at", ""))
-                if now - cached_at < self.ttl:
-                    self._cache[key] = value["playlist"]
-
+            self._mtime = self._file_mtime()
+            self._cache = self._read_file()
             logger.info(f"Loaded {len(self._cache)} entries from cache file")
 
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+        except (ValueError, TypeError, KeyError) as e:
             logger.warning(f"Failed to load cache from file: {str(e)}")
             self._cache = {}
 
+    def _reload_if_changed(self) -> None:
+        """Reload entries written by another process, keeping local pending changes."""
+        if not self.cache_file:
+            return
+
+        mtime = self._file_mtime()
+        if mtime is None or mtime == self._mtime:
+            return
+
+        try:
+            entries = self._read_file()
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Failed to reload cache from file: {str(e)}")
+            return
+
+        for key in self._dirty:
+            if key in self._cache:
+                entries[key] = self._cache[key]
+            else:
+                entries.pop(key, None)
+
+        self._cache = entries
+        self._mtime = mtime
+        logger.debug(f"Reloaded {len(entries)} entries from modified cache file")
+
     def _save_to_file(self) -> None:
         """Save cache to file."""
         if not self.cache_file:
@@ -62,19 +202,46 @@ class PlaylistCache:
             # Ensure parent directory exists
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-            now = datetime.now().isoformat()
+            now = time.time()
             cache_data = {
                 key: {"playlist": value, "cached_at": now} for key, value in self._cache.items()
             }
 
-            with open(self.cache_file, "w") as f:
-                json.dump(cache_data, f, indent=2)
+            with open(self.cache_file, "wb") as f:
+                f.write(_dumps(cache_data))
 
+            self._mtime = self._file_mtime()
             logger.debug(f"Saved {len(self._cache)} entries to cache file")
 
         except Exception as e:
             logger.warning(f"Failed to save cache to file: {str(e)}")
 
+    def _mark_dirty(self, cache_key: str) -> None:
+        """Record a pending change and schedule a delayed write."""
+        self._dirty.add(cache_key)
+
+        if self.cache_file and self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes to the cache file, if any."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            if self._dirty:
+                self._reload_if_changed()
+                self._save_to_file()
+                self._dirty.clear()
+
+    def close(self) -> None:
+        """Write pending changes and stop tracking the cache for the exit flush."""
+        self.flush()
+        _LIVE_CACHES.discard(self)
+
     def get(self, name: str) -> Optional[Dict]:
         """
         Get playlist from cache by name.
@@ -85,8 +252,10 @@ class PlaylistCache:
         Returns:
             Playlist data if found and not expired, None otherwise
         """
-        cache_key = name.lower().strip()
-        playlist = self._cache.get(cache_key)
+        cache_key = self.normalize_key(name)
+        with self._lock:
+            self._reload_if_changed()
+            playlist = self._cache.get(cache_key)
 
         if playlist:
             logger.debug(f"Cache hit for playlist: {name}")
@@ -99,18 +268,18 @@ class PlaylistCache:
         """
         Add or update playlist in cache.
 
+        Only the fields in CACHED_PLAYLIST_KEYS are kept.
+
         Args:
             name: Playlist name
             playlist: Playlist data to cache
         """
-        cache_key = name.lower().strip()
-        self._cache[cache_key] = playlist
+        cache_key = self.normalize_key(name)
+        with self._lock:
+            self._cache[cache_key] = self.slim_playlist(playlist)
+            self._mark_dirty(cache_key)
         logger.debug(f"Added playlist to cache: {name}")
 
-        # Save to file if configured
-        if self.cache_file:
-            self._save_to_file()
-
     def remove(self, name: str) -> None:
         """
         Remove playlist from cache.
@@ -118,22 +287,128 @@ class PlaylistCache:
         Args:
             name: Playlist name to remove
         """
-        cache_key = name.lower().strip()
-        if cache_key in self._cache:
-            del self._cache[cache_key]
-            logger.debug(f"Removed playlist from cache: {name}")
-
-            # Update file if configured
-            if self.cache_file:
-                self._save_to_file()
+        cache_key = self.normalize_key(name)
+        with self._lock:
+            if cache_key in self._cache:
+                del self._cache[cache_key]
+                self._mark_dirty(cache_key)
+                logger.debug(f"Removed playlist from cache: {name}")
 
     def clear(self) -> None:
         """Clear all entries from cache."""
-        self._cache.clear()
+        with self._lock:
+            for cache_key in list(self._cache):
+                self._mark_dirty(cache_key)
+            self._cache.clear()
         logger.info("Cleared all cache entries")
 
-        if self.cache_file:
-            self._save_to_file()
+    def contains(self, name: str) -> bool:
+        """
+        Check if playlist is in cache.
+
+        Args:
+            name: Playlist name to check
+
+        Returns:
+            True if playlist is in cache, False otherwise
+        """
+        cache_key = self.normalize_key(name)
+        with self._lock:
+            self._reload_if_changed()
+            return cache_key in self._cache
+
+
+class SqlitePlaylistCache(PlaylistCache):
+    """
+    Playlist cache backed by a SQLite database.
+
+    Each change is a single-row write, committed atomically, so there is no
+    whole-file rewrite and concurrent processes can share the same file.
+    """
+
+    def __init__(self, cache_file: Path, ttl_hours: int = 24):
+        """
+        Initialize SQLite playlist cache.
+
+        Args:
+            cache_file: Path to the SQLite database file
+            ttl_hours: Time to live for cache entries in hours
+        """
+        super().__init__(cache_file=None, ttl_hours=ttl_hours)
+        self.cache_file = cache_file
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode: every statement is its own transaction
+        self._conn = sqlite3.connect(str(cache_file), isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS playlists "
+            "(name TEXT PRIMARY KEY, data BLOB NOT NULL, cached_at REAL NOT NULL)"
+        )
+
+    def _oldest_valid(self) -> float:
+        """Get the earliest cached_at timestamp that has not expired."""
+        return time.time() - self.ttl.total_seconds()
+
+    def flush(self) -> None:
+        """Nothing to do: every change is written immediately."""
+
+    def get(self, name: str) -> Optional[Dict]:
+        """
+        Get playlist from cache by name.
+
+        Args:
+            name: Playlist name (case-insensitive)
+
+        Returns:
+            Playlist data if found and not expired, None otherwise
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM playlists WHERE name = ? AND cached_at > ?",
+                (self.normalize_key(name), self._oldest_valid()),
+            ).fetchone()
+
+        if row:
+            logger.debug(f"Cache hit for playlist: {name}")
+            return _loads(row[0])
+
+        logger.debug(f"Cache miss for playlist: {name}")
+        return None
+
+    def set(self, name: str, playlist: Dict) -> None:
+        """
+        Add or update playlist in cache.
+
+        Only the fields in CACHED_PLAYLIST_KEYS are kept.
+
+        Args:
+            name: Playlist name
+            playlist: Playlist data to cache
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO playlists (name, data, cached_at) VALUES (?, ?, ?)",
+                (self.normalize_key(name), _dumps(self.slim_playlist(playlist)), time.time()),
+            )
+        logger.debug(f"Added playlist to cache: {name}")
+
+    def remove(self, name: str) -> None:
+        """
+        Remove playlist from cache.
+
+        Args:
+            name: Playlist name to remove
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM playlists WHERE name = ?", (self.normalize_key(name),))
+        logger.debug(f"Removed playlist from cache: {name}")
+
+    def clear(self) -> None:
+        """Clear all entries from cache."""
+        with self._lock:
+            self._conn.execute("DELETE FROM playlists")
+        logger.info("Cleared all cache entries")
 
     def contains(self, name: str) -> bool:
         """
@@ -145,5 +420,30 @@ class PlaylistCache:
         Returns:
             True if playlist is in cache, False otherwise
         """
-        cache_key = name.lower().strip()
-        return cache_key in self._cache
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM playlists WHERE name = ? AND cached_at > ?",
+                (self.normalize_key(name), self._oldest_valid()),
+            ).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+def create_playlist_cache(cache_file: Optional[Path], ttl_hours: int = 24) -> PlaylistCache:
+    """
+    Create a playlist cache, choosing the backend from the file suffix.
+
+    Args:
+        cache_file: Cache file path (``.db``/``.sqlite``/``.sqlite3`` selects
+            SQLite, anything else JSON; None keeps the cache in memory)
+        ttl_hours: Time to live for cache entries in hours
+
+    Returns:
+        Playlist cache instance
+    """
+    if cache_file is not None and cache_file.suffix.lower() in SQLITE_SUFFIXES:
+        return SqlitePlaylistCache(cache_file=cache_file, ttl_hours=ttl_hours)
+    return PlaylistCache(cache_file=cache_file, ttl_hours=ttl_hours)
@@ -5,12 +5,17 @@ Manages Spotify playlist operations following SOLID principles.
 """
 
 import logging
+import threading
+from contextlib import closing
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional
 
 from ..utils.exceptions import PlaylistCreationError
-from .interfaces import IPlaylistOperations, ISpotifyClient
-from .playlist_cache import PlaylistCache
+from .api_limits import SPOTIFY_REMOVE_LIMIT
+from .concurrency import DEFAULT_MAX_WORKERS, fetch_remaining_pages, run_batches
+from .interfaces import TRACK_URI_FIELDS, IPlaylistOperations, ISpotifyClient
+from .playlist_cache import PlaylistCache, create_playlist_cache
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +32,7 @@ class PlaylistManager(IPlaylistOperations):
         cache: Optional[PlaylistCache] = None,
         cache_file: Optional[Path] = None,
         cache_ttl_hours: int = 24,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """
         Initialize playlist manager with dependency injection.
@@ -36,8 +42,14 @@ class PlaylistManager(IPlaylistOperations):
             cache: Optional pre-configured cache instance
             cache_file: Path to cache file (used if cache is not provided)
             cache_ttl_hours: Cache TTL in hours (used if cache is not provided)
+            max_workers: Maximum concurrent requests when fetching paginated results
         """
         self.client = client
+        self.max_workers = max_workers
+        # Normalized name -> playlist, built from the user's playlists on first miss
+        self._name_index: Optional[Dict[str, Dict]] = None
+        # Guards the name index when playlists are synced from several threads
+        self._index_lock = threading.Lock()
 
         # Use provided cache or create new one
         if cache is not None:
@@ -45,8 +57,8 @@ class PlaylistManager(IPlaylistOperations):
         else:
             # Default cache file location if not specified
             if cache_file is None:
-                cache_file = Path.home() / ".spotichart" / "cache" / "playlists.json"
-            self.cache = PlaylistCache(cache_file=cache_file, ttl_hours=cache_ttl_hours)
+                cache_file = Path.home() / ".spotichart" / "cache" / "playlists.db"
+            self.cache = create_playlist_cache(cache_file, ttl_hours=cache_ttl_hours)
 
     def create(self, name: str, description: str, public: bool = False):
         """
@@ -73,6 +85,9 @@ class PlaylistManager(IPlaylistOperations):
 
             # Add to cache
             self.cache.set(name, playlist)
+            with self._index_lock:
+                if self._name_index is not None:
+                    self._name_index[PlaylistCache.normalize_key(name)] = playlist
             logger.info(f"Playlist created successfully: {playlist['id']}")
 
             return playlist
@@ -99,38 +114,80 @@ class PlaylistManager(IPlaylistOperations):
             logger.info(f"Found playlist in cache: {cached_playlist['id']}")
             return cached_playlist
 
-        # Search through user's playlists
-        offset = 0
-        limit = 50
-        checked_count = 0
-
+        # Look the name up in the session's index of the user's playlists
         try:
-            while True:
-                playlists = self.client.current_user_playlists(limit=limit, offset=offset)
+            name_index = self._ensure_name_index()
+        except Exception as e:
+            logger.error(f"Error searching for playlist: {str(e)}")
+            return None
 
-                for item in playlists["items"]:
-                    checked_count += 1
-                    playlist_name = item["name"]
-                    logger.debug(f"Checking playlist #{checked_count}: '{playlist_name}'")
+        playlist = name_index.get(PlaylistCache.normalize_key(name))
+        if playlist is None:
+            logger.info(f"Playlist '{name}' not found among {len(name_index)} playlist names")
+            return None
 
-                    if playlist_name.lower().strip() == name.lower().strip():
-                        logger.info(f"Found existing playlist: {item['id']} - '{playlist_name}'")
-                        # Add to cache for future lookups
-                        self.cache.set(name, item)
-                        return item
+        logger.info(f"Found existing playlist: {playlist['id']} - '{playlist['name']}'")
+        # Add to cache for future lookups
+        self.cache.set(name, playlist)
+        return playlist
 
-                # Check if there are more playlists
-                if not playlists.get("next"):
-                    break
+    def _ensure_name_index(self) -> Dict[str, Dict]:
+        """
+        Get the normalized name to playlist index, building it on first use.
 
-                offset += limit
+        All of the user's playlists are fetched once per session (pages after
+        the first concurrently), so later lookups need no API calls.
 
-            logger.info(f"Playlist '{name}' not found after checking {checked_count} playlists")
-            return None
+        Returns:
+            Index of playlists by normalized name (first occurrence wins)
+        """
+        with self._index_lock:
+            if self._name_index is None:
+                limit = 50
+                first_page = self.client.current_user_playlists(limit=limit, offset=0)
+                remaining_pages = fetch_remaining_pages(
+                    first_page,
+                    lambda offset: self.client.current_user_playlists(limit=limit, offset=offset),
+                    max_workers=self.max_workers,
+                )
+
+                name_index: Dict[str, Dict] = {}
+                for playlists in chain((first_page,), remaining_pages):
+                    for item in playlists["items"]:
+                        name_index.setdefault(PlaylistCache.normalize_key(item["name"]), item)
+
+                self._name_index = name_index
+                logger.debug(f"Indexed {len(name_index)} playlist names")
+
+        return self._name_index
+
+    def _iter_track_uris(self, playlist_id: str) -> Iterator[str]:
+        """
+        Yield the URIs of a playlist's tracks, page by page.
 
-        except Exception as e:
-            logger.error(f"Error searching for playlist: {str(e)}")
-            return None
+        Only URIs are kept; each page of track objects is dropped once read.
+        Pages after the first are fetched concurrently.
+
+        Args:
+            playlist_id: Playlist ID
+
+        Yields:
+            Track URIs in playlist order (local or unavailable items skipped)
+        """
+        first_page = self.client.playlist_tracks(playlist_id, fields=TRACK_URI_FIELDS)
+        remaining_pages = fetch_remaining_pages(
+            first_page,
+            lambda offset: self.client.playlist_tracks(
+                playlist_id, offset=offset, fields=TRACK_URI_FIELDS
+            ),
+            max_workers=self.max_workers,
+        )
+        with closing(remaining_pages):
+            for page in chain((first_page,), remaining_pages):
+                for item in page["items"]:
+                    track = item.get("track")
+                    if track:
+                        yield track["uri"]
 
     def clear(self, playlist_id: str):
         """
@@ -145,24 +202,30 @@ class PlaylistManager(IPlaylistOperations):
         try:
             logger.info(f"Clearing playlist: {playlist_id}")
 
-            # Get all tracks
-            tracks = []
-            results = self.client.playlist_tracks(playlist_id)
-            tracks.extend(results["items"])
-
-            while results.get("next"):
-                results = self.client.next(results)
-                tracks.extend(results["items"])
-
-            # Extract track URIs
-            track_uris = [item["track"]["uri"] for item in tracks if item.get("track")]
+            # Collect every URI before removing anything: removals shift the
+            # offsets of pages that have not been fetched yet. Duplicates are
+            # dropped since each removal covers all occurrences.
+            track_uris = list(dict.fromkeys(self._iter_track_uris(playlist_id)))
+
+            # Removals are order-independent, so batches run concurrently
+            # and each retries rate limits on its own
+            batches = [
+                track_uris[i : i + SPOTIFY_REMOVE_LIMIT]
+                for i in range(0, len(track_uris), SPOTIFY_REMOVE_LIMIT)
+            ]
+            failures = run_batches(
+                lambda batch: self.client.playlist_remove_all_occurrences_of_items(
+                    playlist_id, batch
+                ),
+                batches,
+                max_workers=min(self.max_workers, 4),
+            )
 
-            # Remove in batches of 100
-            if track_uris:
-                for i in range(0, len(track_uris), 100):
-                    batch = track_uris[i : i + 100]
-                    self.client.playlist_remove_all_occurrences_of_items(playlist_id, batch)
-                    logger.debug(f"Removed batch {i // 100 + 1}")
+            if failures:
+                for index, error in failures:
+                    logger.error(f"Failed to remove batch {index + 1}: {error}")
+                logger.error(f"Failed to clear {len(failures)}/{len(batches)} batches")
+                return False
 
             logger.info(f"Cleared {len(track_uris)} tracks from playlist")
             return True
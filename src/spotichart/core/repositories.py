@@ -5,15 +5,41 @@ Abstractions for data access and caching.
 """
 
 import logging
+import sys
 from abc import ABC, abstractmethod
+from contextlib import closing
+from itertools import chain
 from typing import Dict, List, Optional
 
+from .concurrency import DEFAULT_MAX_WORKERS, fetch_remaining_pages
 from .interfaces import IPlaylistReader
 from .models import PlaylistMetadata
 from .playlist_cache import PlaylistCache
 
 logger = logging.getLogger(__name__)
 
+# Spotify's maximum page size for the current user's playlists
+PLAYLISTS_PAGE_SIZE = 50
+
+
+def _share_owners(playlists: List[Dict]) -> None:
+    """
+    Make playlists with the same owner share one interned owner dict.
+
+    A user's playlist list is dominated by their own playlists, so this
+    collapses hundreds of identical owner sub-dicts into a handful.
+
+    Args:
+        playlists: Playlist data as returned by Spotify (updated in place)
+    """
+    owners: Dict[str, Dict] = {}
+    for playlist in playlists:
+        owner = playlist.get("owner")
+        if not owner or "id" not in owner:
+            continue
+        owner_id = sys.intern(owner["id"])
+        playlist["owner"] = owners.setdefault(owner_id, {**owner, "id": owner_id})
+
 
 class IPlaylistRepository(ABC):
     """Interface for playlist repository (Repository Pattern)."""
@@ -80,54 +106,59 @@ class CachedPlaylistRepository(IPlaylistRepository):
     Implements Repository Pattern with caching layer.
     """
 
-    def __init__(self, playlist_reader: IPlaylistReader, cache: Optional[PlaylistCache] = None):
+    def __init__(
+        self,
+        playlist_reader: IPlaylistReader,
+        cache: Optional[PlaylistCache] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
         """
         Initialize repository.
 
         Args:
             playlist_reader: Reader for fetching playlists from Spotify
             cache: Optional cache for storing playlist data
+            max_workers: Maximum concurrent requests when fetching playlist pages
         """
         self._reader = playlist_reader
+        self._max_workers = max_workers
         self._cache = cache or PlaylistCache()
         self._all_playlists_cache: Optional[List[Dict]] = None
+        self._by_id: Dict[str, Dict] = {}
+        # Lookup results for this run, including misses, keyed by normalized name
+        self._lookups: Dict[str, Optional[Dict]] = {}
 
     def find_by_name(self, name: str) -> Optional[Dict]:
         """Find playlist by name with caching."""
+        needle = PlaylistCache.normalize_key(name)
+        if needle in self._lookups:
+            return self._lookups[needle]
+
         # Check cache first
         cached = self._cache.get(name)
         if cached:
             logger.debug(f"Cache hit for playlist: {name}")
+            self._lookups[needle] = cached
             return cached
 
-        # Cache miss - fetch all playlists
+        # Cache miss - fetch all playlists, which caches each one under its
+        # normalized name, so the lookup needs no scan of its own
         logger.debug(f"Cache miss for playlist: {name}")
-        all_playlists = self.get_all()
+        self.get_all()
 
-        # Search for playlist by name
-        for playlist in all_playlists:
-            if playlist["name"] == name:
-                # Update cache
-                self._cache.set(name, playlist)
-                return playlist
-
-        return None
+        found = self._cache.get(name)
+        self._lookups[needle] = found
+        return found
 
     def find_by_id(self, playlist_id: str) -> Optional[Dict]:
         """Find playlist by ID."""
-        # If we have all playlists cached, search there
-        if self._all_playlists_cache:
-            for playlist in self._all_playlists_cache:
-                if playlist["id"] == playlist_id:
-                    return playlist
+        playlist = self._by_id.get(playlist_id)
+        if playlist is not None:
+            return playlist
 
-        # Otherwise, fetch all and search
-        all_playlists = self.get_all()
-        for playlist in all_playlists:
-            if playlist["id"] == playlist_id:
-                return playlist
-
-        return None
+        # Index miss - fetch all playlists (populates the index)
+        self.get_all()
+        return self._by_id.get(playlist_id)
 
     def save(self, playlist: Dict) -> None:
         """Save playlist to cache."""
@@ -135,8 +166,13 @@ class CachedPlaylistRepository(IPlaylistRepository):
 
         if name:
             self._cache.set(name, playlist)
+            self._lookups.pop(PlaylistCache.normalize_key(name), None)
             logger.debug(f"Cached playlist: {name}")
 
+        playlist_id = playlist.get("id")
+        if playlist_id:
+            self._by_id[playlist_id] = playlist
+
         # Invalidate all playlists cache
         self._all_playlists_cache = None
 
@@ -149,23 +185,34 @@ class CachedPlaylistRepository(IPlaylistRepository):
 
         # Fetch from Spotify
         logger.debug("Fetching playlists from Spotify API")
-        playlists = []
-        result = self._reader.current_user_playlists(limit=limit)
-
-        while result and len(playlists) < limit:
-            items = result.get("items", [])
-            playlists.extend(items)
-
-            if len(playlists) >= limit or not result.get("next"):
-                break
-
-            result = self._reader.next(result)
+        playlists: List[Dict] = []
+        page_size = min(limit, PLAYLISTS_PAGE_SIZE)
+        first_page = self._reader.current_user_playlists(limit=page_size)
+
+        if first_page:
+            # The first page reveals the total, so the rest are fetched concurrently
+            remaining_pages = fetch_remaining_pages(
+                first_page,
+                lambda offset: self._reader.current_user_playlists(
+                    limit=page_size, offset=offset
+                ),
+                max_workers=self._max_workers,
+                max_items=limit,
+            )
+            with closing(remaining_pages):
+                for page in chain((first_page,), remaining_pages):
+                    playlists.extend(page.get("items", []))
+                    if len(playlists) >= limit:
+                        break
 
         # Cache the results
+        _share_owners(playlists)
         self._all_playlists_cache = playlists
+        self._by_id.update((p["id"], p) for p in playlists)
 
-        # Also cache individual playlists
-        for playlist in playlists:
+        # Also cache individual playlists (in reverse, so the first playlist
+        # with a given name is the one kept)
+        for playlist in reversed(playlists):
             name = playlist.get("name")
             if name:
                 self._cache.set(name, playlist)
@@ -176,5 +223,7 @@ class CachedPlaylistRepository(IPlaylistRepository):
         """Clear all cached data."""
         logger.info("Clearing playlist cache")
         self._all_playlists_cache = None
+        self._by_id = {}
+        self._lookups = {}
         # Note: PlaylistCache doesn't have a clear method, so we create a new instance
         self._cache = PlaylistCache()
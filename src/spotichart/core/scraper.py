@@ -4,16 +4,23 @@ Web Scraper Module
 Handles scraping of music charts from Kworb.net.
 """
 
+import io
 import logging
 import os
-import time
-from typing import Dict, List, Optional
+import re
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..utils.configuration_provider import ConfigurationProvider
 from ..utils.exceptions import ScrapingError
+from .http_cache import HttpResponseCache
+from .kworb_parser import KworbChartParser
 
 logger = logging.getLogger(__name__)
 
@@ -21,35 +28,100 @@ logger = logging.getLogger(__name__)
 DEFAULT_REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 2
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Track links in Kworb chart rows look like href="../track/<id>.html"
+TRACK_HREF_PREFIX = "../track/"
+TRACK_HREF_PATTERN = re.compile(r"""href=["']\.\./track/([A-Za-z0-9]+)\.html["']""")
+
+# Fast-path markup: the chart table's opening tag and bounds, then one track per body row
+TABLE_TAG_PATTERN = re.compile(r"<table\b[^>]*>", re.IGNORECASE)
+TABLE_ATTR_PATTERN = re.compile(r"""\s(id|class)\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+TABLE_END_PATTERN = re.compile(r"</table\s*>", re.IGNORECASE)
+TABLE_BODY_PATTERN = re.compile(r"<tbody\b.*?</tbody>", re.IGNORECASE | re.DOTALL)
+ROW_START_PATTERN = re.compile(r"<tr\b", re.IGNORECASE)
+
+# Chart table markup, shared with KworbChartParser
+CHART_TABLE_CLASSES = KworbChartParser.TABLE_CLASSES
+CHART_TABLE_IDS = KworbChartParser.TABLE_IDS
 
 # Initialize configuration provider
 _config = ConfigurationProvider()
 
 
+def _is_chart_table(table_id: Optional[str], table_class: Optional[str]) -> bool:
+    """Check whether a table's id/class attributes match a known chart table markup."""
+    if table_id in CHART_TABLE_IDS:
+        return True
+    return not CHART_TABLE_CLASSES.isdisjoint((table_class or "").split())
+
+
+def _build_region_urls() -> Dict[str, str]:
+    """Resolve the Kworb URL of every configured region."""
+    return {region: _config.get_kworb_url(region) for region in _config.get_available_regions()}
+
+
+_REGION_URLS = _build_region_urls()
+
+
+def _refresh_region_urls() -> None:
+    """Rebuild the region URL table, e.g. after the configuration is reloaded."""
+    global _REGION_URLS
+    _REGION_URLS = _build_region_urls()
+
+
 class KworbScraper:
     """Scraper for Kworb.net music charts."""
 
-    def __init__(self, timeout: Optional[int] = None, max_retries: Optional[int] = None):
+    def __init__(
+        self,
+        timeout: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        http_cache: Optional[HttpResponseCache] = None,
+    ):
         """
         Initialize Kworb scraper.
 
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            http_cache: Response cache for conditional requests
+                (defaults to ~/.spotichart/cache/http)
         """
         self.timeout = timeout or DEFAULT_REQUEST_TIMEOUT
         self.max_retries = max_retries or DEFAULT_MAX_RETRIES
+        self.http_cache = http_cache or HttpResponseCache(
+            Path.home() / ".spotichart" / "cache" / "http"
+        )
         self.session = requests.Session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+                "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+                "Accept-Encoding": "gzip, deflate",
             }
         )
 
+        # Let urllib3 retry on the pooled connection instead of reconnecting
+        # from a Python-level loop after every transient failure
+        retry = Retry(
+            total=self.max_retries - 1,
+            backoff_factor=DEFAULT_RETRY_DELAY,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _fetch_page(self, url: str) -> str:
         """
-        Fetch page content with retry logic.
+        Fetch page content.
+
+        Transient failures are retried by the session's transport adapter.
+        Previously fetched pages are revalidated with a conditional request,
+        and a 304 response is served from the local cache.
 
         Args:
             url: URL to fetch
@@ -60,26 +132,32 @@ class KworbScraper:
         Raises:
             ScrapingError: If fetching fails after retries
         """
-        last_error = None
-
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                logger.debug(f"Fetching URL (attempt {attempt}/{self.max_retries}): {url}")
+        try:
+            logger.debug(f"Fetching URL: {url}")
+            headers = self.http_cache.get_validators(url)
+            response = self.session.get(url, timeout=self.timeout, headers=headers)
+
+            if response.status_code == 304:
+                cached = self.http_cache.get(url)
+                if cached:
+                    logger.info(f"Page not modified, using cached copy: {url}")
+                    return cached["content"]
+                # Entry vanished since the validators were read; refetch in full
                 response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                return response.content.decode("utf-8")
 
-            except requests.RequestException as e:
-                last_error = e
-                logger.warning(f"Attempt {attempt} failed: {str(e)}")
+            response.raise_for_status()
+            content = response.content.decode("utf-8")
+            self.http_cache.set(
+                url,
+                content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            return content
 
-                if attempt < self.max_retries:
-                    sleep_time = DEFAULT_RETRY_DELAY * attempt
-                    logger.info(f"Retrying in {sleep_time} seconds...")
-                    time.sleep(sleep_time)
-
-        logger.error(f"Failed to fetch URL after {self.max_retries} attempts")
-        raise ScrapingError(f"Failed to fetch {url}: {str(last_error)}") from last_error
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch URL after {self.max_retries} attempts")
+            raise ScrapingError(f"Failed to fetch {url}: {str(e)}") from e
 
     def _parse_table(self, html: str, limit: int) -> List[Dict[str, str]]:
         """
@@ -95,50 +173,123 @@ class KworbScraper:
         Raises:
             ScrapingError: If table parsing fails
         """
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Try multiple selectors to find the table
-            table = None
-            selectors = [
-                {"class": "display"},
-                {"class": "addpos"},
-                {"id": "spotifyweekly"},
-                {"class": "data"},
-                {"class": "chart"},
-            ]
-
-            for selector in selectors:
-                table = soup.find("table", selector)
-                if table:
-                    logger.debug(f"Found table with selector: {selector}")
-                    break
+        # Fast path: the track link format is rigid, so regex sweeps over the
+        # chart's rows find every ID without building a document tree
+        track_ids = list(islice(self._iter_row_track_ids(html), limit))
+        if track_ids:
+            logger.info(f"Extracted {len(track_ids)} tracks")
+            return [{"track": track_id} for track_id in track_ids]
+
+        logger.debug("No track links matched, falling back to HTML parsing")
+        return self._parse_table_html(html, limit)
+
+    @staticmethod
+    def _iter_row_track_ids(html: str) -> Iterator[str]:
+        """
+        Yield the first track ID of each row in the chart table body.
 
-            if not table:
-                raise ScrapingError("Table not found - site structure may have changed")
+        The chart table is the first one whose opening tag matches a known
+        chart markup, as in the fallback parser. Links outside its body, such
+        as headers, sidebars and other tables, are ignored, and a row linking
+        several tracks yields only the first.
 
-            # Extract data
-            tracks = []
-            tbody = table.find("tbody")
+        Args:
+            html: HTML content
 
-            if not tbody:
-                raise ScrapingError("Table body not found")
+        Yields:
+            Spotify track IDs in chart order
+        """
+        for tag in TABLE_TAG_PATTERN.finditer(html):
+            attrs = {name.lower(): value for name, value in TABLE_ATTR_PATTERN.findall(tag.group())}
+            if _is_chart_table(attrs.get("id"), attrs.get("class")):
+                break
+        else:
+            return
+
+        end = TABLE_END_PATTERN.search(html, tag.end())
+        body = TABLE_BODY_PATTERN.search(html, tag.end(), end.start() if end else len(html))
+        if body is None:
+            return
+
+        for row in ROW_START_PATTERN.split(body.group())[1:]:
+            match = TRACK_HREF_PATTERN.search(row)
+            if match:
+                yield match.group(1)
+
+    def _parse_table_html(self, html: str, limit: int) -> List[Dict[str, str]]:
+        """
+        Stream-parse the chart table rows and extract track information.
 
-            rows = tbody.find_all("tr", limit=limit)
-            logger.info(f"Found {len(rows)} rows in table")
+        Only rows in the body of the first table matching a known chart markup
+        are read. Rows are parsed one at a time and discarded once read, so
+        peak memory stays flat regardless of chart size.
 
-            for row in rows:
-                cells = row.find_all("a")
-                track_id = None
+        Args:
+            html: HTML content
+            limit: Maximum number of tracks to extract
+
+        Returns:
+            List of track dictionaries
 
-                for cell in cells:
-                    href = cell.attrs.get("href", "")
-                    if href.startswith("../track"):
-                        track_id = href.replace("../track/", "").replace(".html", "").strip()
+        Raises:
+            ScrapingError: If the chart table is missing or parsing fails
+        """
+        try:
+            tracks = []
+            chart_table = None
+            in_body = body_found = False
+            events = etree.iterparse(
+                io.BytesIO(html.encode("utf-8")),
+                events=("start", "end"),
+                tag=("table", "tbody", "tr"),
+                html=True,
+            )
+
+            for event, element in events:
+                if element.tag == "table":
+                    if chart_table is None and event == "start":
+                        if _is_chart_table(element.get("id"), element.get("class")):
+                            chart_table = element
+                    elif element is chart_table:
+                        break
+                    continue
+
+                if chart_table is None:
+                    # Rows outside the chart table are never chart entries
+                    if event == "end":
+                        element.clear()
+                    continue
+
+                if element.tag == "tbody":
+                    in_body = event == "start"
+                    body_found = True
+                    continue
+
+                if event != "end" or not in_body:
+                    continue
+
+                for link in element.iter("a"):
+                    href = link.get("href", "")
+                    if href.startswith(TRACK_HREF_PREFIX):
+                        track_id = href[len(TRACK_HREF_PREFIX) :].replace(".html", "").strip()
+                        if track_id:
+                            tracks.append({"track": track_id})
                         break
 
-                if track_id:
-                    tracks.append({"track": track_id})
+                # Free the parsed row and any siblings already processed
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+                if len(tracks) >= limit:
+                    break
+
+            if chart_table is None:
+                raise ScrapingError("Table not found - site structure may have changed")
+            if not body_found:
+                raise ScrapingError("Table body not found")
+            if not tracks:
+                raise ScrapingError("No track rows found - site structure may have changed")
 
             logger.info(f"Extracted {len(tracks)} tracks")
             return tracks
@@ -190,7 +341,7 @@ class KworbScraper:
         Raises:
             ScrapingError: If scraping fails
         """
-        url = _config.get_kworb_url(region)
+        url = _REGION_URLS.get(region.lower()) or _config.get_kworb_url(region)
         logger.info(f"Scraping {region} charts")
         return self.scrape(url, limit)
 
@@ -5,17 +5,66 @@ Handles Spotify API authentication following Single Responsibility Principle.
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import requests
 import spotipy
+from requests.adapters import HTTPAdapter
 from spotipy.oauth2 import SpotifyOAuth
+from urllib3.util.retry import Retry
 
 from ..utils.exceptions import SpotifyAuthError
 
 logger = logging.getLogger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """
+    Build the pooled HTTP session shared by the OAuth manager and API client.
+
+    The transport only retries failed connections, where nothing reached
+    Spotify; rate limits and server errors are retried by SpotifyClient.
+    """
+    session = requests.Session()
+    retry = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=4)
+def _get_shared_spotify(
+    client_id: str,
+    client_secret: str,
+    redirect_uri: str,
+    scope: str,
+    cache_path: Optional[str],
+    request_timeout: int,
+) -> spotipy.Spotify:
+    """
+    Get the Spotify client for a set of credentials, creating it once per process.
+
+    Every authenticator with the same settings reuses the same client and
+    therefore the same pooled connections to the Spotify API.
+    """
+    session = _build_session()
+    auth_manager = SpotifyOAuth(
+        client_id=client_id,
+        client_secret=client_secret,
+        redirect_uri=redirect_uri,
+        scope=scope,
+        show_dialog=True,
+        requests_timeout=request_timeout,
+        cache_path=cache_path,
+        requests_session=session,
+    )
+    return spotipy.Spotify(
+        auth_manager=auth_manager, requests_session=session, requests_timeout=request_timeout
+    )
+
+
 class SpotifyAuthenticator:
     """Handles Spotify OAuth authentication."""
 
@@ -70,21 +119,26 @@ class SpotifyAuthenticator:
 
             cache_path_str = str(self.cache_path) if self.cache_path else None
 
-            auth_manager = SpotifyOAuth(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                redirect_uri=self.redirect_uri,
-                scope=self.scope,
-                show_dialog=True,
-                requests_timeout=self.request_timeout,
-                cache_path=cache_path_str,
+            self._sp = _get_shared_spotify(
+                self.client_id,
+                self.client_secret,
+                self.redirect_uri,
+                self.scope,
+                cache_path_str,
+                self.request_timeout,
             )
-            self._sp = spotipy.Spotify(auth_manager=auth_manager)
 
-            # Verify authentication by getting user info
-            user_info = self._sp.me()
-            self._user_id = user_info["id"]
-            logger.info(f"Successfully authenticated as user: {self._user_id}")
+            # With a cached token, the user ID saved next to it is still valid
+            # and the token itself is verified by the first real API call
+            self._user_id = self._load_user_id()
+            if self._user_id is None and not self._has_cached_token():
+                # Fresh login: verify it right away by getting user info
+                self._fetch_user_id()
+
+            if self._user_id is not None:
+                logger.info(f"Successfully authenticated as user: {self._user_id}")
+            else:
+                logger.info("Authenticated with cached token")
 
             return self._sp
 
@@ -92,6 +146,57 @@ class SpotifyAuthenticator:
             logger.error(f"Failed to authenticate with Spotify: {str(e)}")
             raise SpotifyAuthError(f"Authentication failed: {str(e)}") from e
 
+    def _has_cached_token(self) -> bool:
+        """Check whether a token cache file exists."""
+        return bool(self.cache_path) and self.cache_path.exists()
+
+    def _fetch_user_id(self) -> str:
+        """Get the user ID from the API and save it next to the token cache."""
+        user_info = self._sp.me()
+        self._user_id = user_info["id"]
+        self._save_user_id(self._user_id)
+        return self._user_id
+
+    def _user_id_path(self) -> Optional[Path]:
+        """Get the path of the user ID file kept next to the token cache."""
+        if not self.cache_path:
+            return None
+        return self.cache_path.with_name(self.cache_path.name + ".uid")
+
+    def _load_user_id(self) -> Optional[str]:
+        """
+        Load the user ID saved alongside a cached token.
+
+        Returns:
+            Saved user ID, or None if there is no token cache or saved ID
+        """
+        uid_path = self._user_id_path()
+        if uid_path is None or not self.cache_path.exists() or not uid_path.exists():
+            return None
+
+        try:
+            user_id = uid_path.read_text().strip()
+        except OSError as e:
+            logger.warning(f"Failed to read cached user ID: {str(e)}")
+            return None
+        return user_id or None
+
+    def _save_user_id(self, user_id: str) -> None:
+        """
+        Save the user ID alongside the token cache.
+
+        Args:
+            user_id: Spotify user ID
+        """
+        uid_path = self._user_id_path()
+        if uid_path is None:
+            return
+
+        try:
+            uid_path.write_text(user_id)
+        except OSError as e:
+            logger.warning(f"Failed to save cached user ID: {str(e)}")
+
     def get_client(self) -> spotipy.Spotify:
         """
         Get authenticated Spotify client (lazy loading).
@@ -119,4 +224,13 @@ class SpotifyAuthenticator:
         if self._user_id is None:
             # Trigger authentication if not done yet
             self.authenticate()
+
+        if self._user_id is None:
+            # Only looked up once an operation actually needs it
+            try:
+                self._fetch_user_id()
+            except Exception as e:
+                logger.error(f"Failed to get Spotify user ID: {str(e)}")
+                raise SpotifyAuthError(f"Authentication failed: {str(e)}") from e
+
         return self._user_id
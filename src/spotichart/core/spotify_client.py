@@ -6,15 +6,27 @@ Follows Dependency Inversion Principle by depending on abstractions.
 """
 
 import logging
-from typing import Dict, List, Optional
+import re
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 import spotipy
 
+from .api_limits import SPOTIFY_TRACKS_LIMIT
+from .backoff import call_with_backoff, is_rate_limited, is_retryable
+from .concurrency import map_batches
 from .interfaces import ISpotifyClient
 from .spotify_authenticator import SpotifyAuthenticator
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Attempts per API call before a rate-limit or server error is surfaced
+API_MAX_ATTEMPTS = 5
+
+# Bare base62 track ID or track URI; anything else makes Spotify reject a whole bulk request
+TRACK_ID_PATTERN = re.compile(r"(?:spotify:track:)?[A-Za-z0-9]{22}")
+
 
 class SpotifyClient(ISpotifyClient):
     """
@@ -22,18 +34,41 @@ class SpotifyClient(ISpotifyClient):
     Implements ISpotifyClient interface and delegates to SpotifyAuthenticator.
     """
 
-    def __init__(self, authenticator: SpotifyAuthenticator):
+    def __init__(self, authenticator: SpotifyAuthenticator, max_attempts: int = API_MAX_ATTEMPTS):
         """
         Initialize Spotify client with dependency injection.
 
         Args:
             authenticator: Spotify authenticator instance
+            max_attempts: Attempts per API call when rate limited or on server errors
 
         Raises:
             SpotifyAuthError: If authentication fails
         """
         self._authenticator = authenticator
         self._sp: Optional[spotipy.Spotify] = None
+        self.max_attempts = max_attempts
+
+    def _call(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        retryable: Callable[[Exception], bool] = is_retryable,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Call the Spotify API with the shared backoff policy.
+
+        Waits only when Spotify actually throttles or fails, honoring
+        ``Retry-After`` when sent.
+        """
+        return call_with_backoff(
+            func,
+            *args,
+            max_attempts=self.max_attempts,
+            retryable=retryable,
+            **kwargs,
+        )
 
     @property
     def sp(self) -> spotipy.Spotify:
@@ -73,8 +108,14 @@ class SpotifyClient(ISpotifyClient):
             Playlist information dictionary
         """
         logger.info(f"Creating playlist: {name}")
-        return self.sp.user_playlist_create(
-            user=user, name=name, public=public, description=description
+        # Not idempotent: only retry when the request was rejected outright
+        return self._call(
+            self.sp.user_playlist_create,
+            user=user,
+            name=name,
+            public=public,
+            description=description,
+            retryable=is_rate_limited,
         )
 
     def current_user_playlists(self, limit: int = 50, offset: int = 0) -> Dict:
@@ -88,19 +129,23 @@ class SpotifyClient(ISpotifyClient):
         Returns:
             Dictionary containing playlists
         """
-        return self.sp.current_user_playlists(limit=limit, offset=offset)
+        return self._call(self.sp.current_user_playlists, limit=limit, offset=offset)
 
-    def playlist_tracks(self, playlist_id: str) -> Dict:
+    def playlist_tracks(
+        self, playlist_id: str, offset: int = 0, fields: Optional[str] = None
+    ) -> Dict:
         """
         Get tracks from a playlist.
 
         Args:
             playlist_id: Playlist ID
+            offset: Index of the first track to return
+            fields: Spotify field filter limiting the response to these keys
 
         Returns:
             Dictionary containing tracks
         """
-        return self.sp.playlist_tracks(playlist_id)
+        return self._call(self.sp.playlist_tracks, playlist_id, fields=fields, offset=offset)
 
     def next(self, result: Dict) -> Optional[Dict]:
         """
@@ -112,7 +157,7 @@ class SpotifyClient(ISpotifyClient):
         Returns:
             Next page of results or None
         """
-        return self.sp.next(result)
+        return self._call(self.sp.next, result)
 
     def playlist_remove_all_occurrences_of_items(self, playlist_id: str, items: List[str]) -> Dict:
         """
@@ -125,7 +170,7 @@ class SpotifyClient(ISpotifyClient):
         Returns:
             Result dictionary
         """
-        return self.sp.playlist_remove_all_occurrences_of_items(playlist_id, items)
+        return self._call(self.sp.playlist_remove_all_occurrences_of_items, playlist_id, items)
 
     def playlist_change_details(
         self,
@@ -145,7 +190,8 @@ class SpotifyClient(ISpotifyClient):
             collaborative: Whether playlist is collaborative
             description: New playlist description
         """
-        self.sp.playlist_change_details(
+        self._call(
+            self.sp.playlist_change_details,
             playlist_id=playlist_id,
             name=name,
             public=public,
@@ -168,7 +214,10 @@ class SpotifyClient(ISpotifyClient):
             Result dictionary
         """
         logger.debug(f"Adding {len(items)} items to playlist {playlist_id}")
-        return self.sp.playlist_add_items(playlist_id, items, position)
+        # Not idempotent: a retried 5xx could add the batch twice
+        return self._call(
+            self.sp.playlist_add_items, playlist_id, items, position, retryable=is_rate_limited
+        )
 
     def track(self, track_id: str) -> Optional[Dict]:
         """
@@ -185,3 +234,51 @@ class SpotifyClient(ISpotifyClient):
         except Exception as e:
             logger.warning(f"Track {track_id} not found: {str(e)}")
             return None
+
+    def tracks(self, track_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Get track information for many IDs with bulk requests.
+
+        IDs are looked up 50 at a time, with the batches requested
+        concurrently. Malformed IDs are never sent. If Spotify rejects a
+        batch, its IDs are looked up one by one so a single bad ID does not
+        cost the rest their metadata.
+
+        Args:
+            track_ids: Spotify track IDs
+
+        Returns:
+            Mapping of each ID to its track information, or None if not found
+        """
+        unique_ids = list(dict.fromkeys(track_ids))
+        results: Dict[str, Optional[Dict]] = {}
+
+        valid_ids = []
+        for track_id in unique_ids:
+            if isinstance(track_id, str) and TRACK_ID_PATTERN.fullmatch(track_id):
+                valid_ids.append(track_id)
+            else:
+                logger.warning(f"Skipping invalid track ID: {track_id!r}")
+                results[track_id] = None
+
+        batches = [
+            valid_ids[i : i + SPOTIFY_TRACKS_LIMIT]
+            for i in range(0, len(valid_ids), SPOTIFY_TRACKS_LIMIT)
+        ]
+
+        def fetch_batch(batch: List[str]) -> List[Optional[Dict]]:
+            try:
+                return self._call(self.sp.tracks, batch)["tracks"]
+            except Exception as e:
+                if is_retryable(e):
+                    # Already retried with backoff; single lookups would fail the same way
+                    logger.warning(f"Failed to fetch {len(batch)} tracks: {str(e)}")
+                    return [None] * len(batch)
+                logger.warning(
+                    f"Bulk lookup of {len(batch)} tracks rejected, fetching individually: {str(e)}"
+                )
+                return [self.track(track_id) for track_id in batch]
+
+        for batch, infos in zip(batches, map_batches(fetch_batch, batches)):
+            results.update(zip(batch, infos))
+        return results
@@ -5,9 +5,12 @@ Application service orchestrating playlist and track operations.
 Uses Strategy Pattern for flexible playlist update modes.
 """
 
+import html
 import logging
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..utils.result import Failure, Result, Success
 from .interfaces import (
     IPlaylistOperations,
     IPlaylistReader,
@@ -19,6 +22,9 @@ from .strategies import UpdateStrategyFactory
 
 logger = logging.getLogger(__name__)
 
+# Playlists synced concurrently by sync_many
+DEFAULT_SYNC_WORKERS = 4
+
 
 class SpotifyService:
     """
@@ -55,7 +61,12 @@ class SpotifyService:
         self._track_writer = track_writer or tracks
 
     def create_playlist_with_tracks(
-        self, name: str, track_ids: list, description: str = "", public: bool = False
+        self,
+        name: str,
+        track_ids: list,
+        description: str = "",
+        public: bool = False,
+        dedupe: bool = True,
     ) -> Tuple[str, int, List]:
         """
         Create a new playlist with tracks.
@@ -65,6 +76,7 @@ class SpotifyService:
             track_ids: List of Spotify track IDs
             description: Playlist description
             public: Whether playlist is public
+            dedupe: Add each track only once
 
         Returns:
             Tuple of (playlist_url, added_count, failed_tracks)
@@ -73,10 +85,11 @@ class SpotifyService:
 
         playlist = self.playlists.create(name, description, public)
 
-        if not track_ids:
+        track_uris = self.tracks.build_uris(track_ids, dedupe=dedupe)
+        if not track_uris:
+            logger.info(f"No tracks to add to new playlist: {name}")
             return playlist["external_urls"]["spotify"], 0, []
 
-        track_uris = [self.tracks.build_uri(tid) for tid in track_ids]
         added_count = self.tracks.add_to_playlist(playlist["id"], track_uris)
 
         failed_tracks = []  # Simplified for now
@@ -89,6 +102,7 @@ class SpotifyService:
         description: str = "",
         public: bool = False,
         update_mode: str = "replace",
+        dedupe: bool = True,
     ) -> Tuple[str, int, List, bool]:
         """
         Create or update a playlist using Strategy Pattern.
@@ -99,22 +113,131 @@ class SpotifyService:
             description: Playlist description
             public: Whether playlist is public
             update_mode: Update mode ('replace' or 'append')
+            dedupe: Add each track only once
 
         Returns:
             Tuple of (playlist_url, added_count, failed_tracks, was_updated)
         """
-        logger.info(f"Create or update playlist: {name} (mode: {update_mode})")
+        return self.create_or_update_playlists(
+            [
+                {
+                    "name": name,
+                    "track_ids": track_ids,
+                    "description": description,
+                    "public": public,
+                    "update_mode": update_mode,
+                    "dedupe": dedupe,
+                }
+            ]
+        )[0]
+
+    def create_or_update_playlists(
+        self, requests: List[Dict[str, Any]]
+    ) -> List[Tuple[str, int, List, bool]]:
+        """
+        Create or update several playlists in one pass.
+
+        All names are resolved before any playlist is touched, so the user's
+        playlists are listed once for the whole batch instead of per request.
+
+        Args:
+            requests: Keyword arguments for create_or_update_playlist, one dict per playlist
+
+        Returns:
+            One (playlist_url, added_count, failed_tracks, was_updated) tuple per request
+        """
+        # Resolve every distinct name up front against one playlist listing
+        names = dict.fromkeys(request["name"] for request in requests)
+        existing = {name: self.playlists.find_by_name(name) for name in names}
+
+        results = []
+        for request in requests:
+            name = request["name"]
+            results.append(self._create_or_update(existing[name], **request))
+            if existing[name] is None:
+                # A repeated name in the batch should update the playlist just created
+                existing[name] = self.playlists.find_by_name(name)
+
+        return results
+
+    def sync_many(
+        self, requests: List[Dict[str, Any]], workers: int = DEFAULT_SYNC_WORKERS
+    ) -> List[Result[Tuple[str, int, List, bool], Exception]]:
+        """
+        Create or update several playlists concurrently.
+
+        Names are resolved up front as in create_or_update_playlists, then
+        each playlist is synced on a worker thread. Requests for the same
+        playlist run in order on the same worker; a failure only affects
+        its own request.
+
+        Args:
+            requests: Keyword arguments for create_or_update_playlist, one dict per playlist
+            workers: Maximum number of playlists synced at once
 
-        existing_playlist = self.playlists.find_by_name(name)
+        Returns:
+            One Result per request, in request order
+        """
+        if not requests:
+            return []
+
+        names = dict.fromkeys(request["name"] for request in requests)
+        existing = {name: self.playlists.find_by_name(name) for name in names}
+
+        groups: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            groups.setdefault(request["name"], []).append(index)
+
+        results: List[Optional[Result]] = [None] * len(requests)
+
+        def sync_group(name: str, indexes: List[int]) -> None:
+            playlist = existing[name]
+            for position, index in enumerate(indexes):
+                try:
+                    if playlist is None and position:
+                        # A repeated name should update the playlist just created
+                        playlist = self.playlists.find_by_name(name)
+                    results[index] = Success(self._create_or_update(playlist, **requests[index]))
+                except Exception as e:
+                    logger.error(f"Failed to sync playlist '{name}': {str(e)}")
+                    results[index] = Failure(e)
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(groups))) as executor:
+            futures = [
+                executor.submit(sync_group, name, indexes) for name, indexes in groups.items()
+            ]
+            for future in futures:
+                future.result()
+
+        return results
+
+    def _create_or_update(
+        self,
+        existing_playlist: Optional[Dict],
+        name: str,
+        track_ids: list,
+        description: str = "",
+        public: bool = False,
+        update_mode: str = "replace",
+        dedupe: bool = True,
+    ) -> Tuple[str, int, List, bool]:
+        """Create a playlist, or update an already resolved one, using Strategy Pattern."""
+        logger.info(f"Create or update playlist: {name} (mode: {update_mode})")
 
         if existing_playlist:
             playlist_id = existing_playlist["id"]
             logger.info(f"Found existing playlist: {playlist_id}")
 
+            # Strip blanks before touching the playlist so an empty update costs no requests
+            track_uris = self.tracks.build_uris(track_ids, dedupe=dedupe)
+            if not track_uris and update_mode != "replace":
+                logger.info(f"No tracks to add, leaving playlist {playlist_id} unchanged")
+                self._update_description(existing_playlist, description)
+                return existing_playlist["external_urls"]["spotify"], 0, [], True
+
             # Use Strategy Pattern for update
             try:
                 strategy = UpdateStrategyFactory.create(update_mode)
-                track_uris = [self.tracks.build_uri(tid) for tid in track_ids]
 
                 added_count = strategy.update(
                     playlist_id=playlist_id,
@@ -124,8 +247,7 @@ class SpotifyService:
                     track_writer=self._track_writer,
                 )
 
-                if description:
-                    self.playlists.update_details(playlist_id, description)
+                self._update_description(existing_playlist, description)
 
                 return existing_playlist["external_urls"]["spotify"], added_count, [], True
 
@@ -135,21 +257,41 @@ class SpotifyService:
                 if update_mode == "replace":
                     self.playlists.clear(playlist_id)
 
-                track_uris = [self.tracks.build_uri(tid) for tid in track_ids]
-                added_count = self.tracks.add_to_playlist(playlist_id, track_uris)
+                added_count = 0
+                if track_uris:
+                    added_count = self.tracks.add_to_playlist(playlist_id, track_uris)
 
-                if description:
-                    self.playlists.update_details(playlist_id, description)
+                self._update_description(existing_playlist, description)
 
                 return existing_playlist["external_urls"]["spotify"], added_count, [], True
 
         else:
             logger.info(f"Playlist not found, creating new one")
             url, count, failed = self.create_playlist_with_tracks(
-                name, track_ids, description, public
+                name, track_ids, description, public, dedupe=dedupe
             )
             return url, count, failed, False
 
+    def _update_description(self, playlist: Dict, description: str) -> None:
+        """
+        Update a playlist's description unless it already matches.
+
+        Args:
+            playlist: Existing playlist dict, as returned by find_by_name
+            description: Desired description (empty leaves it untouched)
+        """
+        if not description:
+            return
+
+        # The API returns descriptions HTML-escaped
+        current = html.unescape(playlist.get("description") or "")
+        if current == description:
+            logger.debug(f"Description unchanged, skipping update: {playlist['id']}")
+            return
+
+        if self.playlists.update_details(playlist["id"], description):
+            playlist["description"] = description
+
     def list_playlists(self, limit: int = 50):
         """Get user's playlists."""
         return self.playlists.get_all(limit=limit)
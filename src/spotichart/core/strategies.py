@@ -6,12 +6,57 @@ Different strategies for updating playlists.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import List
+from contextlib import closing
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, Iterator, List, Type
 
-from .interfaces import IPlaylistReader, IPlaylistWriter, ITrackWriter
+from .api_limits import SPOTIFY_ADD_LIMIT, SPOTIFY_REMOVE_LIMIT
+from .concurrency import fetch_remaining_pages, run_batches
+from .interfaces import TRACK_URI_FIELDS, IPlaylistReader, IPlaylistWriter, ITrackWriter
 
 logger = logging.getLogger(__name__)
 
+# Concurrent removal requests per playlist, kept low to stay clear of rate limits
+REMOVE_WORKERS = 4
+
+# Concurrent page requests when reading a playlist's tracks
+READ_WORKERS = 4
+
+_get_uri = itemgetter("uri")
+
+
+def _iter_track_uris(playlist_reader: IPlaylistReader, playlist_id: str) -> Iterator[str]:
+    """
+    Yield the URIs of a playlist's tracks, page by page.
+
+    Pages after the first are fetched concurrently once ``total`` is known.
+    Closing the iterator early cancels page requests that have not started.
+
+    Args:
+        playlist_reader: Reader for playlist operations
+        playlist_id: Playlist ID
+
+    Yields:
+        Track URIs in playlist order (local or unavailable items skipped)
+    """
+    first_page = playlist_reader.playlist_tracks(playlist_id, fields=TRACK_URI_FIELDS)
+    if not first_page:
+        return
+
+    remaining_pages = fetch_remaining_pages(
+        first_page,
+        lambda offset: playlist_reader.playlist_tracks(
+            playlist_id, offset=offset, fields=TRACK_URI_FIELDS
+        ),
+        max_workers=READ_WORKERS,
+    )
+    with closing(remaining_pages):
+        for page in chain((first_page,), remaining_pages):
+            tracks = filter(None, (item.get("track") for item in page.get("items", [])))
+            yield from map(_get_uri, tracks)
+
 
 class IPlaylistUpdateStrategy(ABC):
     """Interface for playlist update strategies (Strategy Pattern)."""
@@ -44,6 +89,16 @@ class IPlaylistUpdateStrategy(ABC):
 class ReplaceStrategy(IPlaylistUpdateStrategy):
     """Strategy that replaces all tracks in playlist."""
 
+    def __init__(self, diff: bool = True):
+        """
+        Initialize replace strategy.
+
+        Args:
+            diff: Only remove and add the tracks that changed when that yields
+                the desired order; False always rewrites the whole playlist
+        """
+        self.diff = diff
+
     def update(
         self,
         playlist_id: str,
@@ -56,31 +111,72 @@ class ReplaceStrategy(IPlaylistUpdateStrategy):
         logger.info(f"Replacing all tracks in playlist {playlist_id}")
 
         # Get all current tracks
-        current_tracks = []
-        result = playlist_reader.playlist_tracks(playlist_id)
-
-        while result:
-            items = result.get("items", [])
-            current_tracks.extend([item["track"]["uri"] for item in items if item.get("track")])
-            result = playlist_reader.next(result) if result.get("next") else None
+        current_tracks = list(_iter_track_uris(playlist_reader, playlist_id))
+
+        if self.diff:
+            desired = set(track_uris)
+            current = set(current_tracks)
+            to_remove = list(dict.fromkeys(uri for uri in current_tracks if uri not in desired))
+            to_add = [uri for uri in track_uris if uri not in current]
+
+            # Removing stale tracks and appending new ones keeps the surviving
+            # tracks in place, so the delta is enough if that gives the desired list
+            kept = [uri for uri in current_tracks if uri in desired]
+            if kept + to_add == track_uris:
+                logger.info(
+                    f"Applying delta: removing {len(to_remove)}, adding {len(to_add)} tracks"
+                )
+                self._remove_tracks_in_batches(playlist_id, to_remove, track_writer)
+                return self._add_tracks_in_batches(playlist_id, to_add, track_writer)
+
+            logger.debug("Track order changed, rewriting the whole playlist")
 
         # Remove all current tracks
         if current_tracks:
             logger.debug(f"Removing {len(current_tracks)} existing tracks")
-            batch_size = 100
-            for i in range(0, len(current_tracks), batch_size):
-                batch = current_tracks[i : i + batch_size]
-                track_writer.playlist_remove_all_occurrences_of_items(playlist_id, batch)
+            # Each removal covers all occurrences, so duplicates are dropped
+            self._remove_tracks_in_batches(
+                playlist_id, list(dict.fromkeys(current_tracks)), track_writer
+            )
 
         # Add new tracks
         return self._add_tracks_in_batches(playlist_id, track_uris, track_writer)
 
+    def _remove_tracks_in_batches(
+        self, playlist_id: str, track_uris: List[str], track_writer: ITrackWriter
+    ) -> None:
+        """
+        Remove all occurrences of tracks in batches of 100 (Spotify API limit).
+
+        Removals are order-independent, so batches run concurrently. Adds are
+        not, since each batch appends after the previous one.
+
+        Raises:
+            The first batch error, once every batch has finished
+        """
+        batch_size = SPOTIFY_REMOVE_LIMIT
+        batches = [track_uris[i : i + batch_size] for i in range(0, len(track_uris), batch_size)]
+        failures = run_batches(
+            lambda batch: track_writer.playlist_remove_all_occurrences_of_items(playlist_id, batch),
+            batches,
+            max_workers=REMOVE_WORKERS,
+        )
+
+        if failures:
+            for index, error in failures:
+                logger.error(f"Failed to remove batch {index + 1}: {error}")
+            raise failures[0][1]
+
     def _add_tracks_in_batches(
         self, playlist_id: str, track_uris: List[str], track_writer: ITrackWriter
     ) -> int:
         """Add tracks in batches of 100 (Spotify API limit)."""
+        if not track_uris:
+            logger.info(f"No tracks to add to playlist {playlist_id}")
+            return 0
+
         added_count = 0
-        batch_size = 100
+        batch_size = SPOTIFY_ADD_LIMIT
 
         for i in range(0, len(track_uris), batch_size):
             batch = track_uris[i : i + batch_size]
@@ -106,33 +202,35 @@ class AppendStrategy(IPlaylistUpdateStrategy):
         track_writer: ITrackWriter,
     ) -> int:
         """Append tracks to the playlist."""
-        logger.info(f"Appending {len(track_uris)} tracks to playlist {playlist_id}")
+        if not track_uris:
+            logger.info(f"No tracks to append, leaving playlist {playlist_id} unchanged")
+            return 0
 
-        # Get existing track URIs to avoid duplicates
-        existing_uris = set()
-        result = playlist_reader.playlist_tracks(playlist_id)
+        logger.info(f"Appending {len(track_uris)} tracks to playlist {playlist_id}")
 
-        while result:
-            items = result.get("items", [])
-            for item in items:
-                if item.get("track"):
-                    existing_uris.add(item["track"]["uri"])
-            result = playlist_reader.next(result) if result.get("next") else None
+        # Only the requested URIs are tracked: each one found in the playlist
+        # is crossed off, and reading stops once none are left to check
+        pending = set(track_uris)
+        existing_uris = _iter_track_uris(playlist_reader, playlist_id)
+        with closing(existing_uris):
+            for uri in existing_uris:
+                pending.discard(uri)
+                if not pending:
+                    break
 
         # Filter out duplicates
-        new_tracks = [uri for uri in track_uris if uri not in existing_uris]
+        new_tracks = [uri for uri in track_uris if uri in pending]
 
         if not new_tracks:
             logger.info("No new tracks to add (all already exist)")
             return 0
 
-        logger.info(
-            f"Adding {len(new_tracks)} new tracks (skipping {len(track_uris) - len(new_tracks)} duplicates)"
-        )
+        skipped = len(track_uris) - len(new_tracks)
+        logger.info(f"Adding {len(new_tracks)} new tracks (skipping {skipped} duplicates)")
 
         # Add new tracks in batches
         added_count = 0
-        batch_size = 100
+        batch_size = SPOTIFY_ADD_LIMIT
 
         for i in range(0, len(new_tracks), batch_size):
             batch = new_tracks[i : i + batch_size]
@@ -150,10 +248,13 @@ class UpdateStrategyFactory:
     """Factory for creating playlist update strategies."""
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create(mode: str) -> IPlaylistUpdateStrategy:
         """
         Create strategy based on update mode.
 
+        Strategies are stateless, so one shared instance is returned per mode.
+
         Args:
             mode: Update mode ('replace' or 'append')
 
@@ -163,10 +264,14 @@ class UpdateStrategyFactory:
         Raises:
             ValueError: If mode is not recognized
         """
-        strategies = {"replace": ReplaceStrategy(), "append": AppendStrategy()}
-
-        strategy = strategies.get(mode.lower())
-        if not strategy:
+        strategy_class = _STRATEGIES.get(mode.lower())
+        if not strategy_class:
             raise ValueError(f"Unknown update mode: {mode}. Must be 'replace' or 'append'")
 
-        return strategy
+        return strategy_class()
+
+
+_STRATEGIES: Dict[str, Type[IPlaylistUpdateStrategy]] = {
+    "replace": ReplaceStrategy,
+    "append": AppendStrategy,
+}
@@ -5,12 +5,18 @@ Manages Spotify track operations following SOLID principles.
 """
 
 import logging
+from typing import Optional
 
 from ..utils.exceptions import TrackAdditionError
+from .api_limits import SPOTIFY_ADD_LIMIT, clamp_batch_size
+from .concurrency import run_batches
 from .interfaces import ISpotifyClient, ITrackOperations
 
 logger = logging.getLogger(__name__)
 
+# Concurrent add requests when track order does not matter
+PARALLEL_ADD_WORKERS = 4
+
 
 class TrackManager(ITrackOperations):
     """
@@ -18,14 +24,16 @@ class TrackManager(ITrackOperations):
     Implements ITrackOperations and depends on ISpotifyClient abstraction.
     """
 
-    def __init__(self, client: ISpotifyClient):
+    def __init__(self, client: ISpotifyClient, batch_size: Optional[int] = None):
         """
         Initialize track manager with dependency injection.
 
         Args:
             client: Spotify client interface
+            batch_size: Tracks per add request (clamped to the API maximum of 100)
         """
         self.client = client
+        self.batch_size = clamp_batch_size(batch_size, SPOTIFY_ADD_LIMIT)
 
     def build_uri(self, track_id: str) -> str:
         """
@@ -39,13 +47,45 @@ class TrackManager(ITrackOperations):
         """
         return f"spotify:track:{track_id}"
 
-    def add_to_playlist(self, playlist_id: str, track_uris: list) -> int:
+    def build_uris(self, track_ids: list, dedupe: bool = True) -> list:
+        """
+        Build Spotify track URIs for many track IDs at once.
+
+        IDs are stripped once each; blank IDs are skipped.
+
+        Args:
+            track_ids: Spotify track IDs
+            dedupe: Drop repeated tracks, keeping the first occurrence
+
+        Returns:
+            Formatted Spotify track URIs, in input order
+        """
+        uris = [
+            f"spotify:track:{stripped}"
+            for track_id in track_ids
+            if track_id and (stripped := track_id.strip())
+        ]
+        if not dedupe:
+            return uris
+
+        unique_uris = list(dict.fromkeys(uris))
+        if len(unique_uris) < len(uris):
+            logger.info(f"Dropped {len(uris) - len(unique_uris)} duplicate tracks")
+        return unique_uris
+
+    def add_to_playlist(self, playlist_id: str, track_uris: list, parallel: bool = False) -> int:
         """
         Add tracks to a playlist in batches.
 
+        Batches are appended one after another so the playlist keeps the
+        order of ``track_uris``. With ``parallel=True`` batches are sent
+        concurrently and may land in any order; use it only when order
+        does not matter.
+
         Args:
             playlist_id: Playlist ID
             track_uris: List of track URIs to add
+            parallel: Send batches concurrently, without preserving order
 
         Returns:
             Number of tracks successfully added
@@ -61,8 +101,10 @@ class TrackManager(ITrackOperations):
             logger.info(f"Adding {len(track_uris)} tracks to playlist {playlist_id}")
             added_count = 0
 
-            # Add tracks in batches of 100 (Spotify API limit)
-            batch_size = 100
+            batch_size = self.batch_size
+            if parallel:
+                return self._add_batches_concurrently(playlist_id, track_uris, batch_size)
+
             for i in range(0, len(track_uris), batch_size):
                 batch = track_uris[i : i + batch_size]
                 self.client.playlist_add_items(playlist_id, batch)
@@ -75,3 +117,34 @@ class TrackManager(ITrackOperations):
         except Exception as e:
             logger.error(f"Failed to add tracks to playlist: {str(e)}")
             raise TrackAdditionError(f"Failed to add tracks: {e}") from e
+
+    def _add_batches_concurrently(self, playlist_id: str, track_uris: list, batch_size: int) -> int:
+        """
+        Add track batches concurrently, in no particular order.
+
+        Returns:
+            Number of tracks successfully added
+
+        Raises:
+            TrackAdditionError: If any batch fails
+        """
+        batches = [track_uris[i : i + batch_size] for i in range(0, len(track_uris), batch_size)]
+        failures = run_batches(
+            lambda batch: self.client.playlist_add_items(playlist_id, batch),
+            batches,
+            max_workers=PARALLEL_ADD_WORKERS,
+        )
+
+        for index, error in failures:
+            logger.error(f"Failed to add batch {index + 1}: {str(error)}")
+
+        failed_count = sum(len(batches[index]) for index, _ in failures)
+        added_count = len(track_uris) - failed_count
+        if failures:
+            raise TrackAdditionError(
+                f"Failed to add {failed_count} of {len(track_uris)} tracks "
+                f"({len(failures)} batches failed)"
+            )
+
+        logger.info(f"Successfully added {added_count} tracks to playlist")
+        return added_count
@@ -5,7 +5,8 @@ Fluent API for constructing complex objects with validation.
 """
 
 import logging
-from typing import List, Optional
+from itertools import chain, islice
+from typing import Dict, List, Optional
 
 from ..application.dtos import CreatePlaylistRequest
 from ..core.models import Track
@@ -14,6 +15,9 @@ from .specifications import AlwaysTrueSpecification, ISpecification
 
 logger = logging.getLogger(__name__)
 
+# Stateless default filter, shared by all builders
+_ACCEPT_ALL: ISpecification[Track] = AlwaysTrueSpecification()
+
 
 class PlaylistBuilder:
     """
@@ -22,6 +26,18 @@ class PlaylistBuilder:
     Implements Builder Pattern for constructing complex CreatePlaylistRequest objects.
     """
 
+    __slots__ = (
+        "_name",
+        "_description",
+        "_public",
+        "_update_mode",
+        "_region",
+        "_track_ids",
+        "_tracks",
+        "_specification",
+        "_pipeline",
+    )
+
     def __init__(self):
         """Initialize builder with default values."""
         self._name: Optional[str] = None
@@ -29,9 +45,10 @@ class PlaylistBuilder:
         self._public: bool = False
         self._update_mode: str = "replace"
         self._region: str = ""
-        self._track_ids: List[str] = []
+        # Insertion-ordered set: O(1) duplicate checks, first occurrence wins
+        self._track_ids: Dict[str, None] = {}
         self._tracks: List[Track] = []
-        self._specification: ISpecification[Track] = AlwaysTrueSpecification()
+        self._specification: ISpecification[Track] = _ACCEPT_ALL
         self._pipeline: Optional[Pipeline[Track]] = None
 
     def with_name(self, name: str) -> "PlaylistBuilder":
@@ -109,8 +126,8 @@ class PlaylistBuilder:
         Returns:
             Self for method chaining
         """
-        if track_id and track_id not in self._track_ids:
-            self._track_ids.append(track_id)
+        if track_id:
+            self._track_ids.setdefault(track_id)
         return self
 
     def add_track_ids(self, track_ids: List[str]) -> "PlaylistBuilder":
@@ -209,8 +226,11 @@ class PlaylistBuilder:
         if not self._name:
             raise ValueError("Playlist name is required")
 
-        # Process tracks through specification filter
-        filtered_tracks = [t for t in self._tracks if self._specification.is_satisfied_by(t)]
+        # Process tracks through specification filter, unless it accepts everything
+        if isinstance(self._specification, AlwaysTrueSpecification):
+            filtered_tracks = self._tracks
+        else:
+            filtered_tracks = list(filter(self._specification.compile(), self._tracks))
 
         if len(filtered_tracks) < len(self._tracks):
             removed = len(self._tracks) - len(filtered_tracks)
@@ -221,11 +241,9 @@ class PlaylistBuilder:
             filtered_tracks = self._pipeline.execute(filtered_tracks)
             logger.info(f"Builder processed {len(filtered_tracks)} tracks through pipeline")
 
-        # Extract track IDs from Track objects
-        track_ids_from_tracks = [t.id for t in filtered_tracks if t.id]
-
-        # Combine with explicitly added track IDs
-        all_track_ids = list(dict.fromkeys(self._track_ids + track_ids_from_tracks))
+        # Combine explicitly added track IDs with those of the tracks, deduping in the same pass
+        track_ids_from_tracks = (t.id for t in filtered_tracks if t.id)
+        all_track_ids = list(dict.fromkeys(chain(self._track_ids, track_ids_from_tracks)))
 
         logger.debug(
             f"Building playlist request: name={self._name}, "
@@ -250,7 +268,15 @@ class PlaylistBuilder:
         Returns:
             Self for method chaining
         """
-        self.__init__()
+        self._name = None
+        self._description = ""
+        self._public = False
+        self._update_mode = "replace"
+        self._region = ""
+        self._track_ids.clear()
+        self._tracks.clear()
+        self._specification = _ACCEPT_ALL
+        self._pipeline = None
         return self
 
 
@@ -261,10 +287,12 @@ class TrackCollectionBuilder:
     Useful for building filtered and processed track lists.
     """
 
+    __slots__ = ("_tracks", "_specification", "_pipeline", "_limit")
+
     def __init__(self):
         """Initialize builder."""
         self._tracks: List[Track] = []
-        self._specification: ISpecification[Track] = AlwaysTrueSpecification()
+        self._specification: ISpecification[Track] = _ACCEPT_ALL
         self._pipeline: Optional[Pipeline[Track]] = None
         self._limit: Optional[int] = None
 
@@ -341,16 +369,16 @@ class TrackCollectionBuilder:
         Returns:
             Processed and filtered list of tracks
         """
-        # Filter tracks
-        result = [t for t in self._tracks if self._specification.is_satisfied_by(t)]
+        # Filter tracks lazily, unless the specification accepts everything
+        if isinstance(self._specification, AlwaysTrueSpecification):
+            matching = iter(self._tracks)
+        else:
+            matching = filter(self._specification.compile(), self._tracks)
 
-        # Process through pipeline
+        # Streaming pipeline steps let filtering and processing stop once the limit is reached
         if self._pipeline:
-            result = self._pipeline.execute(result)
-
-        # Apply limit
-        if self._limit is not None and len(result) > self._limit:
-            result = result[: self._limit]
+            matching = self._pipeline.iter(matching)
+        result = list(islice(matching, self._limit))
 
         logger.debug(f"Built track collection: input={len(self._tracks)}, output={len(result)}")
 
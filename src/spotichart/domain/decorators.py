@@ -5,14 +5,21 @@ Add responsibilities to objects dynamically.
 """
 
 import logging
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from ..core.backoff import DEFAULT_MAX_DELAY, compute_delay, is_rate_limited, is_retryable
 from ..core.interfaces import IPlaylistOperations
+from ..core.playlist_cache import PlaylistCache
 from ..utils.exceptions import PlaylistCreationError
 
 logger = logging.getLogger(__name__)
 
+# Results kept by CachingPlaylistDecorator before the least recently used are evicted
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+
 
 class LoggingPlaylistDecorator(IPlaylistOperations):
     """Decorator that adds logging to playlist operations."""
@@ -31,27 +38,31 @@ class LoggingPlaylistDecorator(IPlaylistOperations):
     def create(self, name: str, description: str, public: bool = False):
         """Create playlist with logging."""
         self._logger.info(f"Creating playlist: {name} (public={public})")
-        start = time.time()
+        start = time.perf_counter()
 
         try:
             result = self._wrapped.create(name, description, public)
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             self._logger.info(f"Playlist created successfully in {duration:.2f}s")
             return result
         except Exception as e:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             self._logger.error(f"Failed to create playlist after {duration:.2f}s: {e}")
             raise
 
     def find_by_name(self, name: str):
         """Find playlist by name with logging."""
-        self._logger.debug(f"Finding playlist by name: {name}")
+        # Lookups are frequent and only logged at debug level, so skip formatting otherwise
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self._logger.debug(f"Finding playlist by name: {name}")
         result = self._wrapped.find_by_name(name)
 
-        if result:
-            self._logger.debug(f"Found playlist: {result.get('id')}")
-        else:
-            self._logger.debug(f"Playlist not found: {name}")
+        if debug:
+            if result:
+                self._logger.debug(f"Found playlist: {result.get('id')}")
+            else:
+                self._logger.debug(f"Playlist not found: {name}")
 
         return result
 
@@ -69,9 +80,12 @@ class LoggingPlaylistDecorator(IPlaylistOperations):
 
     def get_all(self, limit: int = 50):
         """Get all playlists with logging."""
-        self._logger.debug(f"Fetching up to {limit} playlists")
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self._logger.debug(f"Fetching up to {limit} playlists")
         result = self._wrapped.get_all(limit)
-        self._logger.debug(f"Retrieved {len(result)} playlists")
+        if debug:
+            self._logger.debug(f"Retrieved {len(result)} playlists")
         return result
 
 
@@ -86,6 +100,8 @@ class MetricsPlaylistDecorator(IPlaylistOperations):
             wrapped: Playlist operations to wrap
         """
         self._wrapped = wrapped
+        # Guards the counters, which may be updated from several sync workers at once
+        self._lock = threading.Lock()
         self._metrics: Dict[str, int] = {
             "creates": 0,
             "finds": 0,
@@ -99,173 +115,246 @@ class MetricsPlaylistDecorator(IPlaylistOperations):
         """Create playlist and record metric."""
         try:
             result = self._wrapped.create(name, description, public)
-            self._metrics["creates"] += 1
+            self._record("creates")
             return result
         except Exception:
-            self._metrics["errors"] += 1
+            self._record("errors")
             raise
 
     def find_by_name(self, name: str):
         """Find playlist and record metric."""
-        self._metrics["finds"] += 1
+        self._record("finds")
         return self._wrapped.find_by_name(name)
 
     def clear(self, playlist_id: str):
         """Clear playlist and record metric."""
         try:
             result = self._wrapped.clear(playlist_id)
-            self._metrics["clears"] += 1
+            self._record("clears")
             return result
         except Exception:
-            self._metrics["errors"] += 1
+            self._record("errors")
             raise
 
     def update_details(self, playlist_id: str, description: str):
         """Update details and record metric."""
-        self._metrics["updates"] += 1
+        self._record("updates")
         return self._wrapped.update_details(playlist_id, description)
 
     def get_all(self, limit: int = 50):
         """Get all and record metric."""
-        self._metrics["get_alls"] += 1
+        self._record("get_alls")
         return self._wrapped.get_all(limit)
 
+    def _record(self, key: str) -> None:
+        """Increment a metric."""
+        with self._lock:
+            self._metrics[key] += 1
+
     def get_metrics(self) -> Dict[str, int]:
         """Get collected metrics."""
-        return self._metrics.copy()
+        with self._lock:
+            return self._metrics.copy()
 
     def reset_metrics(self) -> None:
         """Reset all metrics to zero."""
-        for key in self._metrics:
-            self._metrics[key] = 0
+        with self._lock:
+            for key in self._metrics:
+                self._metrics[key] = 0
 
 
 class RetryPlaylistDecorator(IPlaylistOperations):
     """Decorator that adds retry logic to playlist operations."""
 
-    def __init__(self, wrapped: IPlaylistOperations, max_retries: int = 3, delay: float = 1.0):
+    def __init__(
+        self,
+        wrapped: IPlaylistOperations,
+        max_retries: int = 3,
+        delay: float = 1.0,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ):
         """
         Initialize retry decorator.
 
         Args:
             wrapped: Playlist operations to wrap
-            max_retries: Maximum number of retries
-            delay: Delay between retries in seconds
+            max_retries: Maximum number of attempts
+            delay: Base delay for the exponential backoff in seconds
+            max_delay: Upper bound for any delay in seconds
         """
         self._wrapped = wrapped
         self._max_retries = max_retries
         self._delay = delay
+        self._max_delay = max_delay
 
     def create(self, name: str, description: str, public: bool = False):
-        """Create playlist with retry logic."""
+        """Create playlist with retry logic (rate limits only, creation is not idempotent)."""
         return self._retry_operation(
-            lambda: self._wrapped.create(name, description, public), "create"
+            self._wrapped.create, name, description, public, retryable=is_rate_limited
         )
 
     def find_by_name(self, name: str):
         """Find playlist with retry logic."""
-        return self._retry_operation(lambda: self._wrapped.find_by_name(name), "find_by_name")
+        return self._retry_operation(self._wrapped.find_by_name, name)
 
     def clear(self, playlist_id: str):
         """Clear playlist with retry logic."""
-        return self._retry_operation(lambda: self._wrapped.clear(playlist_id), "clear")
+        return self._retry_operation(self._wrapped.clear, playlist_id)
 
     def update_details(self, playlist_id: str, description: str):
         """Update details with retry logic."""
-        return self._retry_operation(
-            lambda: self._wrapped.update_details(playlist_id, description), "update_details"
-        )
+        return self._retry_operation(self._wrapped.update_details, playlist_id, description)
 
     def get_all(self, limit: int = 50):
         """Get all with retry logic."""
-        return self._retry_operation(lambda: self._wrapped.get_all(limit), "get_all")
+        return self._retry_operation(self._wrapped.get_all, limit)
+
+    def _retry_operation(
+        self,
+        operation: Callable[..., Any],
+        *args: Any,
+        retryable: Callable[[Exception], bool] = is_retryable,
+        **kwargs: Any,
+    ):
+        """
+        Execute operation with retry logic.
 
-    def _retry_operation(self, operation, operation_name: str):
-        """Execute operation with retry logic."""
-        last_error = None
+        The wrapped method is passed bound, with its arguments, so no closure
+        is built per call.
 
+        Only errors accepted by ``retryable`` (checked on the error or its
+        cause) are retried, with jittered exponential backoff that honors
+        ``Retry-After``. Other errors are raised immediately.
+        """
         for attempt in range(1, self._max_retries + 1):
             try:
-                return operation()
+                return operation(*args, **kwargs)
             except Exception as e:
-                last_error = e
+                # Wrapped errors (e.g. PlaylistCreationError) carry the HTTP error as cause
+                cause = e.__cause__ if isinstance(e.__cause__, Exception) else e
+                if not (retryable(e) or retryable(cause)):
+                    raise
+
+                operation_name = getattr(operation, "__name__", "operation")
                 logger.warning(
                     f"{operation_name} failed (attempt {attempt}/{self._max_retries}): {e}"
                 )
+                if attempt >= self._max_retries:
+                    logger.error(f"{operation_name} failed after {self._max_retries} attempts")
+                    raise
 
-                if attempt < self._max_retries:
-                    time.sleep(self._delay * attempt)  # Exponential backoff
-
-        logger.error(f"{operation_name} failed after {self._max_retries} attempts")
-        raise last_error
+                time.sleep(compute_delay(cause, attempt, self._delay, self._max_delay))
 
 
 class CachingPlaylistDecorator(IPlaylistOperations):
     """Decorator that adds caching to playlist operations."""
 
-    def __init__(self, wrapped: IPlaylistOperations, cache_ttl_seconds: int = 300):
+    def __init__(
+        self,
+        wrapped: IPlaylistOperations,
+        cache_ttl_seconds: int = 300,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ):
         """
         Initialize caching decorator.
 
         Args:
             wrapped: Playlist operations to wrap
             cache_ttl_seconds: Cache time-to-live in seconds
+            max_entries: Maximum number of cached results (least recently used evicted)
         """
         self._wrapped = wrapped
-        self._cache: Dict[str, tuple] = {}  # {key: (value, timestamp)}
+        # {key: (value, expires_at)}, least recently used first
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
         self._cache_ttl = cache_ttl_seconds
+        self._max_entries = max_entries
 
     def create(self, name: str, description: str, public: bool = False):
-        """Create playlist and invalidate cache."""
+        """Create playlist and invalidate affected cache entries."""
         result = self._wrapped.create(name, description, public)
-        self._invalidate_cache()
+        self._invalidate_cache(self._find_key(name), drop_misses=True)
         return result
 
     def find_by_name(self, name: str):
         """Find playlist with caching."""
-        cache_key = f"find:{name}"
+        return self._cached(self._find_key(name), lambda: self._wrapped.find_by_name(name))
 
-        # Check cache
-        if cache_key in self._cache:
-            cached_value, cached_time = self._cache[cache_key]
-            if time.time() - cached_time < self._cache_ttl:
-                logger.debug(f"Cache hit for: {cache_key}")
-                return cached_value
-
-        # Cache miss
-        result = self._wrapped.find_by_name(name)
-        self._cache[cache_key] = (result, time.time())
-        return result
+    @staticmethod
+    def _find_key(name: str) -> str:
+        """Cache key for a name lookup, matching names the way find_by_name does."""
+        return f"find:{PlaylistCache.normalize_key(name)}"
 
     def clear(self, playlist_id: str):
-        """Clear playlist and invalidate cache."""
+        """Clear playlist and invalidate affected cache entries."""
         result = self._wrapped.clear(playlist_id)
-        self._invalidate_cache()
+        self._invalidate_cache(playlist_id=playlist_id)
         return result
 
     def update_details(self, playlist_id: str, description: str):
-        """Update details and invalidate cache."""
+        """Update details and invalidate affected cache entries."""
         result = self._wrapped.update_details(playlist_id, description)
-        self._invalidate_cache()
+        self._invalidate_cache(playlist_id=playlist_id)
         return result
 
     def get_all(self, limit: int = 50):
         """Get all with caching."""
-        cache_key = f"get_all:{limit}"
+        return self._cached(f"get_all:{limit}", lambda: self._wrapped.get_all(limit))
+
+    def _cached(self, cache_key: str, load: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, loading and storing it on a miss.
 
-        # Check cache
-        if cache_key in self._cache:
-            cached_value, cached_time = self._cache[cache_key]
-            if time.time() - cached_time < self._cache_ttl:
+        Args:
+            cache_key: Cache key
+            load: Callable producing the value on a miss
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            value, expires_at = entry
+            if time.monotonic() < expires_at:
                 logger.debug(f"Cache hit for: {cache_key}")
-                return cached_value
+                self._cache.move_to_end(cache_key)
+                return value
+            del self._cache[cache_key]
+
+        value = load()
+        self._cache[cache_key] = (value, time.monotonic() + self._cache_ttl)
+        if len(self._cache) > self._max_entries:
+            self._evict()
+        return value
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones, until within bounds."""
+        now = time.monotonic()
+        for key in [key for key, (_, expires_at) in self._cache.items() if expires_at <= now]:
+            del self._cache[key]
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+    def _invalidate_cache(
+        self, *keys: str, playlist_id: Optional[str] = None, drop_misses: bool = False
+    ) -> None:
+        """
+        Invalidate the cache entries a mutation may have made stale.
 
-        # Cache miss
-        result = self._wrapped.get_all(limit)
-        self._cache[cache_key] = (result, time.time())
-        return result
+        Playlist listings are always dropped. Lookups are dropped by key, or
+        when they resolved to the mutated playlist.
 
-    def _invalidate_cache(self) -> None:
-        """Invalidate all cache entries."""
-        self._cache.clear()
+        Args:
+            *keys: Cache keys to drop
+            playlist_id: ID of the mutated playlist, if known
+            drop_misses: Also drop every cached lookup that found no playlist
+        """
+        for key in list(self._cache):
+            value = self._cache[key][0]
+            if (
+                key.startswith("get_all:")
+                or key in keys
+                or (drop_misses and key.startswith("find:") and value is None)
+                or (playlist_id and isinstance(value, dict) and value.get("id") == playlist_id)
+            ):
+                del self._cache[key]
         logger.debug("Cache invalidated")
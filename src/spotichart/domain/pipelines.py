@@ -4,9 +4,11 @@ Pipeline Pattern
 Modular processing of data through composable steps.
 """
 
+import heapq
 import logging
 from abc import ABC, abstractmethod
-from typing import Generic, List, TypeVar
+from itertools import islice
+from typing import Dict, Generic, Iterable, Iterator, List, TypeVar
 
 from ..core.interfaces import ITrackReader
 from ..core.models import Track
@@ -33,6 +35,22 @@ class IPipelineStep(ABC, Generic[T]):
         """
         pass
 
+    def iter_process(self, items: Iterable[T]) -> Iterator[T]:
+        """
+        Process items lazily.
+
+        Steps that look at one item at a time override this to stream, so a
+        consumer that stops early (e.g. at a limit) skips the remaining work.
+        The default materializes the items and delegates to process.
+
+        Args:
+            items: Items to process
+
+        Yields:
+            Processed items
+        """
+        yield from self.process(list(items))
+
 
 class Pipeline(Generic[T]):
     """
@@ -62,17 +80,49 @@ class Pipeline(Generic[T]):
         """
         Execute pipeline on items.
 
+        Consecutive streaming steps (filters, duplicate removal, limits) run
+        fused in a single pass, and a limit stops upstream work once reached.
+        Lists are only built where a step needs its whole input.
+
         Args:
             items: Items to process
 
         Returns:
             Processed items
         """
-        result = items
-        for step in self._steps:
-            logger.debug(f"Executing step: {step.__class__.__name__}")
-            result = step.process(result)
-        return result
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Executing steps: {', '.join(step.__class__.__name__ for step in self._steps)}"
+            )
+        return list(self.iter(items))
+
+    def iter(self, items: Iterable[T]) -> Iterator[T]:
+        """
+        Execute pipeline on items lazily.
+
+        Streaming steps pass items through one at a time; other steps (e.g.
+        sorting or enrichment) still need all of their input first. A sort
+        directly followed by a limit only selects the top items.
+
+        Args:
+            items: Items to process
+
+        Returns:
+            Iterator over processed items
+        """
+        result: Iterable[T] = items
+        steps = self._steps
+        index = 0
+        while index < len(steps):
+            step = steps[index]
+            next_step = steps[index + 1] if index + 1 < len(steps) else None
+            if isinstance(step, SortTracksStep) and isinstance(next_step, LimitTracksStep):
+                result = iter(step.top(result, next_step.limit))
+                index += 2
+            else:
+                result = step.iter_process(result)
+                index += 1
+        return iter(result)
 
     def clear(self) -> "Pipeline[T]":
         """
@@ -104,7 +154,7 @@ class ValidateTrackStep(IPipelineStep[Track]):
 
     def process(self, tracks: List[Track]) -> List[Track]:
         """Validate and filter tracks."""
-        valid_tracks = [t for t in tracks if self.specification.is_satisfied_by(t)]
+        valid_tracks = list(filter(self.specification.compile(), tracks))
         removed_count = len(tracks) - len(valid_tracks)
 
         if removed_count > 0:
@@ -112,19 +162,17 @@ class ValidateTrackStep(IPipelineStep[Track]):
 
         return valid_tracks
 
+    def iter_process(self, tracks: Iterable[Track]) -> Iterator[Track]:
+        """Validate and filter tracks lazily."""
+        return filter(self.specification.compile(), tracks)
+
 
 class RemoveDuplicatesStep(IPipelineStep[Track]):
     """Step that removes duplicate tracks."""
 
     def process(self, tracks: List[Track]) -> List[Track]:
         """Remove duplicates based on track ID."""
-        seen = set()
-        result = []
-
-        for track in tracks:
-            if track.id not in seen:
-                seen.add(track.id)
-                result.append(track)
+        result = list(self.iter_process(tracks))
 
         removed_count = len(tracks) - len(result)
         if removed_count > 0:
@@ -132,6 +180,14 @@ class RemoveDuplicatesStep(IPipelineStep[Track]):
 
         return result
 
+    def iter_process(self, tracks: Iterable[Track]) -> Iterator[Track]:
+        """Remove duplicates based on track ID, lazily."""
+        seen = set()
+        for track in tracks:
+            if track.id not in seen:
+                seen.add(track.id)
+                yield track
+
 
 class FilterBySpecificationStep(IPipelineStep[Track]):
     """Step that filters tracks using a specification."""
@@ -147,7 +203,7 @@ class FilterBySpecificationStep(IPipelineStep[Track]):
 
     def process(self, tracks: List[Track]) -> List[Track]:
         """Filter tracks using specification."""
-        filtered = [t for t in tracks if self.specification.is_satisfied_by(t)]
+        filtered = list(filter(self.specification.compile(), tracks))
         removed_count = len(tracks) - len(filtered)
 
         if removed_count > 0:
@@ -155,6 +211,10 @@ class FilterBySpecificationStep(IPipelineStep[Track]):
 
         return filtered
 
+    def iter_process(self, tracks: Iterable[Track]) -> Iterator[Track]:
+        """Filter tracks using specification, lazily."""
+        return filter(self.specification.compile(), tracks)
+
 
 class LimitTracksStep(IPipelineStep[Track]):
     """Step that limits number of tracks."""
@@ -175,6 +235,10 @@ class LimitTracksStep(IPipelineStep[Track]):
             return tracks[: self.limit]
         return tracks
 
+    def iter_process(self, tracks: Iterable[Track]) -> Iterator[Track]:
+        """Limit tracks to specified count, lazily."""
+        return islice(tracks, self.limit)
+
 
 class EnrichTrackMetadataStep(IPipelineStep[Track]):
     """Step that enriches tracks with metadata from Spotify."""
@@ -190,38 +254,38 @@ class EnrichTrackMetadataStep(IPipelineStep[Track]):
 
     def process(self, tracks: List[Track]) -> List[Track]:
         """Enrich tracks with metadata."""
-        enriched = []
-        enriched_count = 0
-
-        for track in tracks:
-            # Skip if already has metadata
-            if track.name and track.artist:
-                enriched.append(track)
-                continue
-
-            # Fetch metadata
-            metadata = self.track_reader.track(track.id)
-            if metadata:
-                enriched_track = Track(
-                    id=track.id,
-                    name=metadata.get("name"),
-                    artist=(
-                        metadata.get("artists", [{}])[0].get("name")
-                        if metadata.get("artists")
-                        else None
-                    ),
-                    album=metadata.get("album", {}).get("name") if metadata.get("album") else None,
-                )
-                enriched.append(enriched_track)
-                enriched_count += 1
-            else:
-                enriched.append(track)
+        # Fetch metadata in bulk for every track that lacks it, once per ID
+        missing_ids = list(
+            dict.fromkeys(track.id for track in tracks if not (track.name and track.artist))
+        )
+        metadata_by_id = self.track_reader.tracks(missing_ids) if missing_ids else {}
+
+        # Tracks that already have metadata, or whose lookup failed, are kept as is
+        enriched = [
+            track
+            if (track.name and track.artist) or not metadata_by_id.get(track.id)
+            else self._from_metadata(track.id, metadata_by_id[track.id])
+            for track in tracks
+        ]
+        enriched_count = sum(1 for old, new in zip(tracks, enriched) if old is not new)
 
         if enriched_count > 0:
             logger.info(f"Enriched {enriched_count} tracks with metadata")
 
         return enriched
 
+    @staticmethod
+    def _from_metadata(track_id: str, metadata: Dict) -> Track:
+        """Build a track from Spotify track metadata."""
+        artists = metadata.get("artists")
+        album = metadata.get("album")
+        return Track(
+            id=track_id,
+            name=metadata.get("name"),
+            artist=artists[0].get("name") if artists else None,
+            album=album.get("name") if album else None,
+        )
+
 
 class SortTracksStep(IPipelineStep[Track]):
     """Step that sorts tracks."""
@@ -242,3 +306,22 @@ class SortTracksStep(IPipelineStep[Track]):
         if self.key_func:
             return sorted(tracks, key=self.key_func, reverse=self.reverse)
         return tracks  # Preserve order if no key function
+
+    def top(self, tracks: Iterable[Track], limit: int) -> List[Track]:
+        """
+        Get the first tracks in sort order, without sorting all of them.
+
+        Equivalent to sorting and keeping the first ``limit`` tracks, in
+        O(n log limit) instead of O(n log n).
+
+        Args:
+            tracks: Tracks to select from
+            limit: Maximum number of tracks
+
+        Returns:
+            Up to limit tracks, sorted
+        """
+        if not self.key_func:
+            return list(islice(tracks, limit))
+        select = heapq.nlargest if self.reverse else heapq.nsmallest
+        return select(limit, tracks, key=self.key_func)
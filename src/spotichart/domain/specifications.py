@@ -5,7 +5,7 @@ Composable business rules for filtering and validation.
 """
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Callable, Generic, TypeVar
 
 T = TypeVar("T")
 
@@ -26,6 +26,18 @@ class ISpecification(ABC, Generic[T]):
         """
         pass
 
+    def compile(self) -> Callable[[T], bool]:
+        """
+        Build a predicate equivalent to is_satisfied_by for filtering many items.
+
+        Composite specifications resolve their children once here instead of
+        on every item.
+
+        Returns:
+            Callable checking one item
+        """
+        return self.is_satisfied_by
+
     def and_(self, other: "ISpecification[T]") -> "ISpecification[T]":
         """
         Combine with AND logic.
@@ -78,6 +90,11 @@ class AndSpecification(ISpecification[T]):
         """Check if both specifications are satisfied."""
         return self.left.is_satisfied_by(item) and self.right.is_satisfied_by(item)
 
+    def compile(self) -> Callable[[T], bool]:
+        """Build a predicate checking both specifications."""
+        left, right = self.left.compile(), self.right.compile()
+        return lambda item: left(item) and right(item)
+
 
 class OrSpecification(ISpecification[T]):
     """Specification that combines two specs with OR."""
@@ -97,6 +114,11 @@ class OrSpecification(ISpecification[T]):
         """Check if either specification is satisfied."""
         return self.left.is_satisfied_by(item) or self.right.is_satisfied_by(item)
 
+    def compile(self) -> Callable[[T], bool]:
+        """Build a predicate checking either specification."""
+        left, right = self.left.compile(), self.right.compile()
+        return lambda item: left(item) or right(item)
+
 
 class NotSpecification(ISpecification[T]):
     """Specification that negates another spec."""
@@ -114,6 +136,11 @@ class NotSpecification(ISpecification[T]):
         """Check if specification is NOT satisfied."""
         return not self.spec.is_satisfied_by(item)
 
+    def compile(self) -> Callable[[T], bool]:
+        """Build a predicate negating the specification."""
+        spec = self.spec.compile()
+        return lambda item: not spec(item)
+
 
 # ============================================================================
 # Concrete Specifications for Tracks
@@ -128,7 +155,9 @@ class TrackIdValidSpecification(ISpecification[Track]):
 
     def is_satisfied_by(self, track: Track) -> bool:
         """Check if track has a valid ID."""
-        return track.id is not None and len(track.id.strip()) > 0
+        # A non-empty string strips to something unless it is all whitespace
+        track_id = track.id
+        return bool(track_id) and not track_id.isspace()
 
 
 class TrackHasMetadataSpecification(ISpecification[Track]):
@@ -136,12 +165,8 @@ class TrackHasMetadataSpecification(ISpecification[Track]):
 
     def is_satisfied_by(self, track: Track) -> bool:
         """Check if track has name and artist."""
-        return (
-            track.name is not None
-            and len(track.name.strip()) > 0
-            and track.artist is not None
-            and len(track.artist.strip()) > 0
-        )
+        name, artist = track.name, track.artist
+        return bool(name) and not name.isspace() and bool(artist) and not artist.isspace()
 
 
 class AlwaysTrueSpecification(ISpecification[T]):
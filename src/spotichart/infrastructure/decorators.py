@@ -6,8 +6,11 @@ Implements Open/Closed Principle and Decorator Pattern.
 """
 
 import logging
+import threading
 import time
-from functools import wraps
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from functools import partial, wraps
 from typing import Any, Callable, Dict, Optional, TypeVar, cast
 
 from ..core.interfaces import IPlaylistOperations
@@ -16,6 +19,9 @@ from ..utils.result import Failure, Result
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+# Entries kept per cache by CachingPlaylistOperationsDecorator
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+
 
 # ============================================================================
 # LOGGING DECORATOR
@@ -43,47 +49,56 @@ class LoggingPlaylistOperationsDecorator(IPlaylistOperations):
     def create(self, name: str, description: str = "", public: bool = False) -> Dict:
         """Create playlist with logging."""
         self._logger.info(f"Creating playlist: '{name}' (public={public})")
-        start = time.time()
+        start = time.perf_counter()
         try:
             result = self._wrapped.create(name, description, public)
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             self._logger.info(
                 f"Playlist created successfully in {duration:.2f}s: {result.get('id', 'unknown')}"
             )
             return result
         except Exception as e:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             self._logger.error(f"Failed to create playlist after {duration:.2f}s: {e}")
             raise
 
     def get_all(self, limit: int = 50) -> list:
         """Get all playlists with logging."""
-        self._logger.debug(f"Fetching up to {limit} playlists")
-        start = time.time()
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self._logger.debug(f"Fetching up to {limit} playlists")
+        start = time.perf_counter()
         try:
             result = self._wrapped.get_all(limit)
-            duration = time.time() - start
-            self._logger.debug(f"Fetched {len(result)} playlists in {duration:.2f}s")
+            if debug:
+                duration = time.perf_counter() - start
+                self._logger.debug(f"Fetched {len(result)} playlists in {duration:.2f}s")
             return result
         except Exception as e:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             self._logger.error(f"Failed to fetch playlists after {duration:.2f}s: {e}")
             raise
 
     def find_by_name(self, name: str) -> Optional[Dict]:
         """Find playlist by name with logging."""
-        self._logger.debug(f"Searching for playlist: '{name}'")
-        start = time.time()
+        # Lookups are frequent and only logged at debug level, so skip formatting otherwise
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self._logger.debug(f"Searching for playlist: '{name}'")
+        start = time.perf_counter()
         try:
             result = self._wrapped.find_by_name(name)
-            duration = time.time() - start
-            if result:
-                self._logger.debug(f"Found playlist '{name}' in {duration:.2f}s")
-            else:
-                self._logger.debug(f"Playlist '{name}' not found (searched in {duration:.2f}s)")
+            if debug:
+                duration = time.perf_counter() - start
+                if result:
+                    self._logger.debug(f"Found playlist '{name}' in {duration:.2f}s")
+                else:
+                    self._logger.debug(
+                        f"Playlist '{name}' not found (searched in {duration:.2f}s)"
+                    )
             return result
         except Exception as e:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             self._logger.error(f"Error searching for playlist after {duration:.2f}s: {e}")
             raise
 
@@ -92,26 +107,26 @@ class LoggingPlaylistOperationsDecorator(IPlaylistOperations):
     ) -> None:
         """Update playlist details with logging."""
         self._logger.info(f"Updating playlist {playlist_id}")
-        start = time.time()
+        start = time.perf_counter()
         try:
             self._wrapped.update_details(playlist_id, description, name)
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             self._logger.info(f"Playlist updated successfully in {duration:.2f}s")
         except Exception as e:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             self._logger.error(f"Failed to update playlist after {duration:.2f}s: {e}")
             raise
 
     def clear(self, playlist_id: str) -> None:
         """Clear playlist with logging."""
         self._logger.info(f"Clearing playlist {playlist_id}")
-        start = time.time()
+        start = time.perf_counter()
         try:
             self._wrapped.clear(playlist_id)
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             self._logger.info(f"Playlist cleared successfully in {duration:.2f}s")
         except Exception as e:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             self._logger.error(f"Failed to clear playlist after {duration:.2f}s: {e}")
             raise
 
@@ -190,17 +205,17 @@ class RetryPlaylistOperationsDecorator(IPlaylistOperations):
     def create(self, name: str, description: str = "", public: bool = False) -> Dict:
         """Create playlist with retry."""
         return self._retry_operation(
-            lambda: self._wrapped.create(name, description, public), "Create playlist"
+            partial(self._wrapped.create, name, description, public), "Create playlist"
         )
 
     def get_all(self, limit: int = 50) -> list:
         """Get all playlists with retry."""
-        return self._retry_operation(lambda: self._wrapped.get_all(limit), "Get all playlists")
+        return self._retry_operation(partial(self._wrapped.get_all, limit), "Get all playlists")
 
     def find_by_name(self, name: str) -> Optional[Dict]:
         """Find playlist by name with retry."""
         return self._retry_operation(
-            lambda: self._wrapped.find_by_name(name), f"Find playlist '{name}'"
+            partial(self._wrapped.find_by_name, name), f"Find playlist '{name}'"
         )
 
     def update_details(
@@ -208,13 +223,13 @@ class RetryPlaylistOperationsDecorator(IPlaylistOperations):
     ) -> None:
         """Update playlist details with retry."""
         self._retry_operation(
-            lambda: self._wrapped.update_details(playlist_id, description, name),
+            partial(self._wrapped.update_details, playlist_id, description, name),
             "Update playlist details",
         )
 
     def clear(self, playlist_id: str) -> None:
         """Clear playlist with retry."""
-        self._retry_operation(lambda: self._wrapped.clear(playlist_id), "Clear playlist")
+        self._retry_operation(partial(self._wrapped.clear, playlist_id), "Clear playlist")
 
 
 # ============================================================================
@@ -222,6 +237,20 @@ class RetryPlaylistOperationsDecorator(IPlaylistOperations):
 # ============================================================================
 
 
+# Operations whose metrics MetricsPlaylistOperationsDecorator reports
+TRACKED_OPERATIONS = ("create", "get_all", "find_by_name", "update_details", "clear")
+
+
+@dataclass
+class _OperationMetrics:
+    """Counters for one decorated operation."""
+
+    calls: int = 0
+    successes: int = 0
+    failures: int = 0
+    total_duration: float = 0.0
+
+
 class MetricsPlaylistOperationsDecorator(IPlaylistOperations):
     """
     Decorator that collects metrics about playlist operations.
@@ -237,12 +266,10 @@ class MetricsPlaylistOperationsDecorator(IPlaylistOperations):
             wrapped: The service to wrap
         """
         self._wrapped = wrapped
-        self._metrics: Dict[str, Dict[str, Any]] = {
-            "create": {"calls": 0, "successes": 0, "failures": 0, "total_duration": 0.0},
-            "get_all": {"calls": 0, "successes": 0, "failures": 0, "total_duration": 0.0},
-            "find_by_name": {"calls": 0, "successes": 0, "failures": 0, "total_duration": 0.0},
-            "update_details": {"calls": 0, "successes": 0, "failures": 0, "total_duration": 0.0},
-            "clear": {"calls": 0, "successes": 0, "failures": 0, "total_duration": 0.0},
+        # Guards the counters, which may be updated from several sync workers at once
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _OperationMetrics] = {
+            operation: _OperationMetrics() for operation in TRACKED_OPERATIONS
         }
 
     def _track_operation(self, operation: Callable[[], T], operation_name: str) -> T:
@@ -259,45 +286,49 @@ class MetricsPlaylistOperationsDecorator(IPlaylistOperations):
         Raises:
             Any exception from operation
         """
-        self._metrics[operation_name]["calls"] += 1
-        start = time.time()
+        start = time.perf_counter()
+        succeeded = False
 
         try:
             result = operation()
-            self._metrics[operation_name]["successes"] += 1
+            succeeded = True
             return result
-        except Exception as e:
-            self._metrics[operation_name]["failures"] += 1
-            raise
         finally:
-            duration = time.time() - start
-            self._metrics[operation_name]["total_duration"] += duration
+            duration = time.perf_counter() - start
+            with self._lock:
+                metrics = self._metrics[operation_name]
+                metrics.calls += 1
+                if succeeded:
+                    metrics.successes += 1
+                else:
+                    metrics.failures += 1
+                metrics.total_duration += duration
 
     def create(self, name: str, description: str = "", public: bool = False) -> Dict:
         """Create playlist with metrics."""
         return self._track_operation(
-            lambda: self._wrapped.create(name, description, public), "create"
+            partial(self._wrapped.create, name, description, public), "create"
         )
 
     def get_all(self, limit: int = 50) -> list:
         """Get all playlists with metrics."""
-        return self._track_operation(lambda: self._wrapped.get_all(limit), "get_all")
+        return self._track_operation(partial(self._wrapped.get_all, limit), "get_all")
 
     def find_by_name(self, name: str) -> Optional[Dict]:
         """Find playlist by name with metrics."""
-        return self._track_operation(lambda: self._wrapped.find_by_name(name), "find_by_name")
+        return self._track_operation(partial(self._wrapped.find_by_name, name), "find_by_name")
 
     def update_details(
         self, playlist_id: str, description: Optional[str] = None, name: Optional[str] = None
     ) -> None:
         """Update playlist details with metrics."""
         self._track_operation(
-            lambda: self._wrapped.update_details(playlist_id, description, name), "update_details"
+            partial(self._wrapped.update_details, playlist_id, description, name), "update_details"
         )
 
     def clear(self, playlist_id: str) -> None:
         """Clear playlist with metrics."""
-        self._track_operation(lambda: self._wrapped.clear(playlist_id), "clear")
+        self._track_operation(partial(self._wrapped.clear, playlist_id), "clear")
 
     def get_metrics(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -306,9 +337,12 @@ class MetricsPlaylistOperationsDecorator(IPlaylistOperations):
         Returns:
             Dictionary with metrics for each operation
         """
+        with self._lock:
+            snapshot = {operation: asdict(data) for operation, data in self._metrics.items()}
+
         # Calculate average durations
         metrics_with_averages = {}
-        for operation, data in self._metrics.items():
+        for operation, data in snapshot.items():
             metrics_with_averages[operation] = {
                 **data,
                 "average_duration": (
@@ -321,13 +355,9 @@ class MetricsPlaylistOperationsDecorator(IPlaylistOperations):
 
     def reset_metrics(self) -> None:
         """Reset all metrics to zero."""
-        for operation in self._metrics:
-            self._metrics[operation] = {
-                "calls": 0,
-                "successes": 0,
-                "failures": 0,
-                "total_duration": 0.0,
-            }
+        with self._lock:
+            for operation in self._metrics:
+                self._metrics[operation] = _OperationMetrics()
 
 
 # ============================================================================
@@ -342,79 +372,107 @@ class CachingPlaylistOperationsDecorator(IPlaylistOperations):
     Caches results to reduce API calls.
     """
 
-    def __init__(self, wrapped: IPlaylistOperations, ttl_seconds: float = 300.0):
+    def __init__(
+        self,
+        wrapped: IPlaylistOperations,
+        ttl_seconds: float = 300.0,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ):
         """
         Initialize decorator.
 
         Args:
             wrapped: The service to wrap
             ttl_seconds: Time-to-live for cache entries
+            max_entries: Maximum entries per cache (least recently used evicted)
         """
         self._wrapped = wrapped
         self._ttl = ttl_seconds
-        self._cache: Dict[str, tuple[Any, float]] = {}
+        self._max_entries = max_entries
+        # Separate caches so mutations only drop the entries they can affect.
+        # Entries are (value, expires_at), least recently used first.
+        self._find_cache: "OrderedDict[str, tuple[Any, float]]" = OrderedDict()  # by name
+        self._get_all_cache: "OrderedDict[int, tuple[Any, float]]" = OrderedDict()  # by limit
 
-    def _get_cached(self, key: str) -> Optional[Any]:
+    def _get_cached(self, cache: OrderedDict, key: Any) -> Optional[Any]:
         """Get cached value if not expired."""
-        if key in self._cache:
-            value, timestamp = self._cache[key]
-            if time.time() - timestamp < self._ttl:
+        entry = cache.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if time.monotonic() < expires_at:
                 logger.debug(f"Cache hit for: {key}")
+                cache.move_to_end(key)
                 return value
             else:
                 logger.debug(f"Cache expired for: {key}")
-                del self._cache[key]
+                del cache[key]
         return None
 
-    def _set_cache(self, key: str, value: Any) -> None:
-        """Set cached value with timestamp."""
-        self._cache[key] = (value, time.time())
+    def _set_cache(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        """Set cached value with its expiry time, evicting the least recently used if full."""
+        cache[key] = (value, time.monotonic() + self._ttl)
+        cache.move_to_end(key)
+        while len(cache) > self._max_entries:
+            cache.popitem(last=False)
         logger.debug(f"Cached: {key}")
 
+    def _invalidate_playlist(self, playlist_id: str) -> None:
+        """Drop lookups that resolved to a playlist, along with all listings."""
+        stale = [
+            name
+            for name, (value, _) in self._find_cache.items()
+            if isinstance(value, dict) and value.get("id") == playlist_id
+        ]
+        for name in stale:
+            del self._find_cache[name]
+        self._get_all_cache.clear()
+
     def _invalidate_cache(self) -> None:
         """Invalidate all cache entries."""
-        self._cache.clear()
+        self._find_cache.clear()
+        self._get_all_cache.clear()
         logger.debug("Cache invalidated")
 
     def create(self, name: str, description: str = "", public: bool = False) -> Dict:
-        """Create playlist (invalidates cache)."""
+        """Create playlist (invalidates listings and lookups of its name)."""
         result = self._wrapped.create(name, description, public)
-        self._invalidate_cache()  # Invalidate cache since playlists changed
+        self._find_cache.pop(name, None)
+        self._get_all_cache.clear()
         return result
 
     def get_all(self, limit: int = 50) -> list:
         """Get all playlists (cached)."""
-        cache_key = f"get_all_{limit}"
-        cached = self._get_cached(cache_key)
+        cached = self._get_cached(self._get_all_cache, limit)
         if cached is not None:
             return cached
 
         result = self._wrapped.get_all(limit)
-        self._set_cache(cache_key, result)
+        self._set_cache(self._get_all_cache, limit, result)
         return result
 
     def find_by_name(self, name: str) -> Optional[Dict]:
         """Find playlist by name (cached)."""
-        cache_key = f"find_by_name_{name}"
-        cached = self._get_cached(cache_key)
+        cached = self._get_cached(self._find_cache, name)
         if cached is not None:
             return cached
 
         result = self._wrapped.find_by_name(name)
-        self._set_cache(cache_key, result)
+        self._set_cache(self._find_cache, name, result)
         return result
 
     def update_details(
         self, playlist_id: str, description: Optional[str] = None, name: Optional[str] = None
     ) -> None:
-        """Update playlist details (invalidates cache)."""
+        """Update playlist details (invalidates entries for that playlist)."""
         self._wrapped.update_details(playlist_id, description, name)
-        self._invalidate_cache()
+        self._invalidate_playlist(playlist_id)
+        if name:
+            self._find_cache.pop(name, None)
 
     def clear(self, playlist_id: str) -> None:
-        """Clear playlist (invalidates cache)."""
+        """Clear playlist (invalidates entries for that playlist)."""
         self._wrapped.clear(playlist_id)
-        self._invalidate_cache()
+        self._invalidate_playlist(playlist_id)
 
     def clear_cache(self) -> None:
         """Manually clear cache."""
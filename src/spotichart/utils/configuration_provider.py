@@ -6,11 +6,18 @@ Provides configuration from YAML file following Dependency Inversion Principle.
 
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 try:
     import yaml
+
+    try:
+        # libyaml's C loader is several times faster than the pure-Python one
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
 except ImportError:
     yaml = None
 from dotenv import load_dotenv
@@ -21,6 +28,35 @@ from .interfaces import IConfiguration
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _env_key(key: str) -> str:
+    """Map a dotted config key to its environment variable name."""
+    return key.upper().replace(".", "_")
+
+
+def _flatten(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Index every value of a nested config by its dotted key.
+
+    Intermediate sections are indexed too, so 'spotify' and 'spotify.scope'
+    both resolve.
+
+    Args:
+        config: Nested configuration dictionary
+        prefix: Dotted key of config itself
+
+    Returns:
+        Flat mapping of dotted key to value
+    """
+    flat: Dict[str, Any] = {}
+    for key, value in config.items():
+        dotted = f"{prefix}{key}"
+        flat[dotted] = value
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{dotted}."))
+    return flat
+
+
 class ConfigurationProvider(IConfiguration):
     """
     Configuration provider that loads from YAML file and environment variables.
@@ -39,6 +75,7 @@ class ConfigurationProvider(IConfiguration):
             ConfigurationError: If configuration file is not found or invalid
         """
         self._config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
         self._env_loaded = False
 
         # Load environment variables
@@ -54,6 +91,7 @@ class ConfigurationProvider(IConfiguration):
 
         # Load YAML configuration
         self._load_yaml_config()
+        self._flat = _flatten(self._config) if isinstance(self._config, dict) else {}
 
     def _load_env(self) -> None:
         """Load environment variables from .env file."""
@@ -83,8 +121,9 @@ class ConfigurationProvider(IConfiguration):
             return
 
         try:
-            with open(self.config_file, "r") as f:
-                self._config = yaml.safe_load(f) or {}
+            # Bytes go straight to libyaml, skipping the Python-level decode
+            with open(self.config_file, "rb") as f:
+                self._config = yaml.load(f, Loader=_YamlLoader) or {}
             logger.info(f"Loaded configuration from {self.config_file}")
 
         except yaml.YAMLError as e:
@@ -149,22 +188,12 @@ class ConfigurationProvider(IConfiguration):
             30
         """
         # Try environment variable first for sensitive data
-        env_key = key.upper().replace(".", "_")
-        env_value = os.getenv(env_key)
+        env_value = os.environ.get(_env_key(key))
         if env_value is not None:
             return env_value
 
-        # Navigate through nested dictionary
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        # Dotted keys are indexed once at load time
+        return self._flat.get(key, default)
 
     def get_kworb_url(self, region: str = "brazil") -> str:
         """
@@ -232,3 +261,4 @@ class ConfigurationProvider(IConfiguration):
         """Reload configuration from file."""
         logger.info("Reloading configuration")
         self._load_yaml_config()
+        self._flat = _flatten(self._config) if isinstance(self._config, dict) else {}